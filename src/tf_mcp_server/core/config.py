@@ -4,12 +4,17 @@ Configuration management for Azure Terraform MCP Server.
 
 import os
 import json
+import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 import asyncio
 from pydantic import BaseModel, Field
 from httpx import AsyncClient
 
+# Schema loading can happen while the stdio transport is live, so status goes
+# to the log (stderr) rather than stdout, which carries the MCP protocol
+logger = logging.getLogger(__name__)
+
 
 class ServerConfig(BaseModel):
     """Server configuration settings."""
@@ -83,27 +88,27 @@ def load_azapi_schema() -> Dict[str, Any]:
         try:
             with open(latest_schema_file, 'r', encoding='utf-8') as f:
                 schema_data = json.load(f)
-                print(f"Loaded AzAPI schemas from {latest_schema_file}")
+                logger.info(f"Loaded AzAPI schemas from {latest_schema_file}")
                 return schema_data
         except json.JSONDecodeError as e:
-            print(f"Warning: Invalid JSON in {latest_schema_file}: {e}")
+            logger.warning(f"Invalid JSON in {latest_schema_file}: {e}")
         except UnicodeDecodeError as e:
-            print(f"Warning: Encoding error in {latest_schema_file}: {e}")
+            logger.warning(f"Encoding error in {latest_schema_file}: {e}")
     
     # If no versioned file exists, try to load or generate schemas
     try:
-        print("No local versioned schema found. Checking for updates...")
+        logger.info("No local versioned schema found. Checking for updates...")
         schema_data = asyncio.run(generator.load_or_generate_schemas())
         
         if schema_data:
-            print(f"Successfully loaded/generated AzAPI schemas")
+            logger.info("Successfully loaded/generated AzAPI schemas")
             return schema_data
     except Exception as e:
-        print(f"Warning: Failed to load/generate AzAPI schemas: {e}")
+        logger.warning(f"Failed to load/generate AzAPI schemas: {e}")
     
     # Fallback: try to download from GitHub
     try:
-        print("Falling back to downloading schema from GitHub...")
+        logger.info("Falling back to downloading schema from GitHub...")
         schema_data = asyncio.run(_download_azapi_schema())
         
         # Save the downloaded schema to local file for future use
@@ -111,12 +116,12 @@ def load_azapi_schema() -> Dict[str, Any]:
             # Save with a fallback version name
             fallback_file = get_data_dir() / "azapi_schemas_fallback.json"
             _save_schema_to_file(fallback_file, schema_data)
-            print(f"Successfully downloaded and saved schema to {fallback_file}")
+            logger.info(f"Successfully downloaded and saved schema to {fallback_file}")
             return schema_data
     except Exception as e:
-        print(f"Warning: Failed to download schema from GitHub: {e}")
+        logger.warning(f"Failed to download schema from GitHub: {e}")
     
-    print("Warning: AzAPI schema not available. AzAPI functionality will be limited.")
+    logger.warning("AzAPI schema not available. AzAPI functionality will be limited.")
     return {}
 
 
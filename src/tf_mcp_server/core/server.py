@@ -338,6 +338,10 @@ def create_server(config: Config) -> FastMCP:
             False, description="Auto-approve for apply/destroy commands (USE WITH CAUTION!)"),
         upgrade: bool = Field(
             False, description="Upgrade providers/modules for init command"),
+        parallelism: int = Field(
+            0, ge=0, description="Concurrent provider operations for plan/apply/destroy/refresh (0 uses Terraform's default of 10)"),
+        refresh: bool = Field(
+            True, description="Refresh state before plan; set false for faster plans that may miss drift"),
         state_subcommand: str = Field(
             "", description="State subcommand (list, show, mv, rm, pull, push) - required when command='state'"),
         state_args: str = Field(
@@ -364,6 +368,9 @@ def create_server(config: Config) -> FastMCP:
             workspace_folder: Workspace folder containing Terraform files
             auto_approve: Auto-approve for destructive operations (apply/destroy)
             upgrade: Upgrade providers/modules during init
+            parallelism: Concurrent provider operations for plan/apply/destroy/refresh; raising it
+                speeds up large configs, but some Azure APIs throttle above ~10
+            refresh: Refresh state before plan; disabling it trades drift detection for speed
             state_subcommand: State operation to perform:
                 - 'list': List all resources in state
                 - 'show': Show details of a specific resource
@@ -477,6 +484,10 @@ def create_server(config: Config) -> FastMCP:
             kwargs['auto_approve'] = auto_approve
         elif command == 'init' and upgrade:
             kwargs['upgrade'] = upgrade
+        if command in ['plan', 'apply', 'destroy', 'refresh'] and parallelism:
+            kwargs['parallelism'] = parallelism
+        if command == 'plan' and not refresh:
+            kwargs['refresh'] = False
 
         try:
             result = await terraform_runner.execute_terraform_command(
@@ -776,7 +787,9 @@ def create_server(config: Config) -> FastMCP:
         parallelism: int = Field(
             10, description="Number of parallel operations"),
         continue_on_error: bool = Field(
-            False, description="Continue export even if some resources fail")
+            False, description="Continue export even if some resources fail"),
+        include_state: bool = Field(
+            False, description="Include the generated terraform.tfstate in the returned files")
     ) -> Dict[str, Any]:
         """
         Export a single Azure resource to Terraform configuration using aztfexport.
@@ -795,6 +808,7 @@ def create_server(config: Config) -> FastMCP:
             include_role_assignment: Whether to include role assignments in the export
             parallelism: Number of parallel operations for export (1-50)
             continue_on_error: Whether to continue if some resources fail during export
+            include_state: Whether to return terraform.tfstate with the generated files (it can be large and contain secrets)
 
         Returns:
             Export result containing generated Terraform files, status, and any errors
@@ -820,7 +834,8 @@ def create_server(config: Config) -> FastMCP:
                 dry_run=dry_run,
                 include_role_assignment=include_role_assignment,
                 parallelism=parallelism,
-                continue_on_error=continue_on_error
+                continue_on_error=continue_on_error,
+                include_state=include_state
             )
 
             return result
@@ -852,7 +867,9 @@ def create_server(config: Config) -> FastMCP:
         parallelism: int = Field(
             10, description="Number of parallel operations"),
         continue_on_error: bool = Field(
-            False, description="Continue export even if some resources fail")
+            False, description="Continue export even if some resources fail"),
+        include_state: bool = Field(
+            False, description="Include the generated terraform.tfstate in the returned files")
     ) -> Dict[str, Any]:
         """
         Export Azure resource group and its resources to Terraform configuration using aztfexport.
@@ -871,6 +888,7 @@ def create_server(config: Config) -> FastMCP:
             include_role_assignment: Whether to include role assignments in the export
             parallelism: Number of parallel operations for export (1-50)
             continue_on_error: Whether to continue if some resources fail during export
+            include_state: Whether to return terraform.tfstate with the generated files (it can be large and contain secrets)
 
         Returns:
             Export result containing generated Terraform files, status, and any errors
@@ -896,7 +914,8 @@ def create_server(config: Config) -> FastMCP:
                 dry_run=dry_run,
                 include_role_assignment=include_role_assignment,
                 parallelism=parallelism,
-                continue_on_error=continue_on_error
+                continue_on_error=continue_on_error,
+                include_state=include_state
             )
 
             return result
@@ -928,7 +947,9 @@ def create_server(config: Config) -> FastMCP:
         parallelism: int = Field(
             10, description="Number of parallel operations"),
         continue_on_error: bool = Field(
-            False, description="Continue export even if some resources fail")
+            False, description="Continue export even if some resources fail"),
+        include_state: bool = Field(
+            False, description="Include the generated terraform.tfstate in the returned files")
     ) -> Dict[str, Any]:
         """
         Export Azure resources using Azure Resource Graph query to Terraform configuration.
@@ -947,6 +968,7 @@ def create_server(config: Config) -> FastMCP:
             include_role_assignment: Whether to include role assignments in the export
             parallelism: Number of parallel operations for export (1-50)
             continue_on_error: Whether to continue if some resources fail during export
+            include_state: Whether to return terraform.tfstate with the generated files (it can be large and contain secrets)
 
         Returns:
             Export result containing generated Terraform files, status, and any errors
@@ -978,7 +1000,8 @@ def create_server(config: Config) -> FastMCP:
                 dry_run=dry_run,
                 include_role_assignment=include_role_assignment,
                 parallelism=parallelism,
-                continue_on_error=continue_on_error
+                continue_on_error=continue_on_error,
+                include_state=include_state
             )
 
             return result
@@ -1698,3 +1721,6 @@ async def run_server(config: Config) -> None:
     except Exception as e:
         logger.error(f"Server error: {e}")
         raise
+    finally:
+        await get_azapi_documentation_provider().aclose()
+        await get_azurerm_documentation_provider().aclose()
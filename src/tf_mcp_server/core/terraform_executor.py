@@ -3,23 +3,453 @@ Terraform execution utilities for Azure Terraform MCP Server.
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import mmap
+import os
 import re
 import shlex
 import shutil
+import stat
 import subprocess
 import tempfile
 from asyncio.subprocess import Process
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from .models import ValidationResult
 from .utils import extract_hcl_from_markdown, extract_error_messages
 
 logger = logging.getLogger(__name__)
 
+# Resolved terraform binary and its version string, shared by every executor so
+# the `terraform version` probe runs once per process rather than per instance.
+_TF_BIN: Optional[str] = None
+_TF_VERSION: Optional[str] = None
+
+# `terraform output -json` can be large for big states; orjson parses it several
+# times faster and raises a json.JSONDecodeError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Patterns used to fingerprint the providers/modules an HCL snippet depends on
+_SOURCE_RE = re.compile(r'^\s*source\s*=\s*"([^"]+)"', re.MULTILINE)
+_RESOURCE_PROVIDER_RE = re.compile(r'^\s*(?:resource|data)\s+"([A-Za-z0-9]+)_', re.MULTILINE)
+_MODULE_RE = re.compile(r'^\s*module\s+"([^"]+)"\s*\{', re.MULTILINE)
+# Attributes inside a block body, which may also be written on one line
+_SOURCE_ATTR_RE = re.compile(r'\bsource\s*=\s*"([^"]+)"')
+_VERSION_ATTR_RE = re.compile(r'\bversion\s*=\s*"([^"]+)"')
+_REQUIRED_PROVIDER_RE = re.compile(r'([A-Za-z][\w-]*)\s*=\s*\{([^{}]*)\}')
+# Provider entries in .terraform.lock.hcl
+_LOCK_PROVIDER_RE = re.compile(r'^provider\s+"([^"]+)"\s*\{(.*?)^\}', re.MULTILINE | re.DOTALL)
+_LOCK_CONSTRAINTS_RE = re.compile(r'^\s*constraints\s*=\s*"([^"]*)"', re.MULTILINE)
+_DEFAULT_REGISTRY = 'registry.terraform.io'
+
+# Output cleaning patterns and tables, built once at import
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# Same pattern over raw bytes, applied to subprocess output while it is being read
+_ANSI_BYTES_RE = re.compile(_ANSI_RE.pattern.encode('ascii'))
+# C0 controls (except tab/newline/carriage return) and DEL, deleted from raw
+# output bytes; C1 controls are multi-byte in UTF-8 and are dropped by
+# _UNICODE_TABLE instead
+_CTRL_BYTES = bytes([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Fixed command prefixes; builders only append the variable tail
+_VALIDATE_CMD = ('validate',)
+_INIT_VALIDATE_CMD = ('init', '-no-color', '-backend=false', '-input=false')
+_PLAN_CMD = ('plan', '-no-color', '-detailed-exitcode')
+_INIT_CMD = ('init', '-no-color')
+_APPLY_CMD = ('apply', '-no-color')
+_DESTROY_CMD = ('destroy', '-no-color')
+_REFRESH_CMD = ('refresh', '-no-color')
+_SHOW_CMD = ('show', '-no-color')
+_OUTPUT_CMD = ('output', '-no-color')
+_WORKSPACE_LIST_CMD = ('workspace', 'list')
+_WORKSPACE_SELECT_CMD = ('workspace', 'select')
+_WORKSPACE_NEW_CMD = ('workspace', 'new')
+
+# Subprocess pipe read size
+_READ_CHUNK = 64 * 1024
+# Outputs at least this long are cleaned in a worker thread
+_THREAD_CLEAN_SIZE = 64 * 1024
+
+_HTML_ENTITIES = {
+    '-&gt;': '->',  # Replace HTML arrow
+    '&lt;': '<',  # Less than
+    '&gt;': '>',  # Greater than
+    '&amp;': '&',  # Ampersand
+}
+# Longest entity first so the arrow wins over the bare '&gt;'
+_HTML_ENTITY_RE = re.compile(
+    '|'.join(re.escape(entity) for entity in sorted(_HTML_ENTITIES, key=len, reverse=True))
+)
+
+# Box-drawing and other special Unicode characters with ASCII equivalents
+_UNICODE_REPLACEMENTS = {
+    # C0 controls (except tab/newline/carriage return), DEL and C1 controls are removed
+    **dict.fromkeys(map(chr, [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)]), ''),
+    '\u2500': '-',  # Horizontal line
+    '\u2502': '|',  # Vertical line
+    '\u2514': '+',  # Up and right
+    '\u2518': '+',  # Up and left
+    '\u2551': '|',  # Double vertical
+    '\u2550': '-',  # Double horizontal
+    '\u2554': '+',  # Double down and right
+    '\u2557': '+',  # Double down and left
+    '\u255a': '+',  # Double up and right
+    '\u255d': '+',  # Double up and left
+    '\u256c': '+',  # Double cross
+    '\u2588': '#',  # Full block
+    '\u25cf': '*',  # Black circle
+    '\u2574': '-',  # Left box drawing
+    '\u2576': '-',  # Right box drawing
+    '\u2577': '|',  # Down box drawing
+    '\u2575': '|',  # Up box drawing
+}
+# str.translate only has a fast path for ASCII text, where the table is used
+_UNICODE_TABLE = str.maketrans(_UNICODE_REPLACEMENTS)
+# For other text it does a dict lookup per character, which is far slower than
+# a memchr-backed str.replace per character actually present; keep the mapping
+# as parallel tuples for that loop
+_UNICODE_SOURCES = tuple(_UNICODE_REPLACEMENTS)
+_UNICODE_TARGETS = tuple(_UNICODE_REPLACEMENTS.values())
+
+
+def _plan_options(kwargs: Dict[str, Any]) -> List[str]:
+    """Extra arguments for `terraform plan` in execute_in_workspace."""
+    args: List[str] = []
+    if kwargs.get('var_file'):
+        args.extend(['-var-file', kwargs['var_file']])
+    if kwargs.get('detailed_exitcode'):
+        args.append('-detailed-exitcode')
+    if kwargs.get('refresh') is False:
+        args.append('-refresh=false')
+    return args
+
+
+def _apply_options(kwargs: Dict[str, Any]) -> List[str]:
+    """Extra arguments for `terraform apply` and `terraform destroy` in execute_in_workspace."""
+    args: List[str] = []
+    if kwargs.get('var_file'):
+        args.extend(['-var-file', kwargs['var_file']])
+    if kwargs.get('auto_approve'):
+        args.append('-auto-approve')
+    return args
+
+
+def _init_options(kwargs: Dict[str, Any]) -> List[str]:
+    """Extra arguments for `terraform init` in execute_in_workspace."""
+    return ['-upgrade'] if kwargs.get('upgrade') else []
+
+
+# Command-specific option builders, looked up by the base command
+_COMMAND_OPTIONS = {
+    'plan': _plan_options,
+    'apply': _apply_options,
+    'destroy': _apply_options,
+    'init': _init_options,
+}
+_PARALLELISM_COMMANDS = frozenset({'plan', 'apply', 'destroy', 'refresh'})
+
+
+def _open_output_file(name: str):
+    """
+    Open an anonymous file a child process can write its output into.
+    
+    Uses a memfd where available (Linux) and an unlinked temporary file elsewhere.
+    
+    Args:
+        name: Debug name for the memory file
+        
+    Returns:
+        Binary file object
+    """
+    if hasattr(os, 'memfd_create'):
+        return os.fdopen(os.memfd_create(name, os.MFD_CLOEXEC), 'w+b')
+    return tempfile.TemporaryFile(prefix=f'{name}-')
+
+
+def _read_output_file(output_file) -> str:
+    """
+    Decode everything a child process wrote into an output file.
+    
+    The file is mapped rather than read so the text is decoded straight from
+    the page cache without an intermediate bytes copy.
+    
+    Args:
+        output_file: File object passed to the child as stdout/stderr
+        
+    Returns:
+        Decoded output text
+    """
+    size = os.fstat(output_file.fileno()).st_size
+    if not size:
+        return ''
+    with mmap.mmap(output_file.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+        return str(mapped, 'utf-8')
+
+
+
+# Entries kept when a warm working directory is recycled
+_LOCKFILE_NAME = '.terraform.lock.hcl'
+_WARM_DIR_KEEP = frozenset({'.terraform', _LOCKFILE_NAME})
+
+
+def _private_plugin_cache_dir() -> Optional[Path]:
+    """
+    Get the provider plugin cache shared by the executor's scratch directories.
+
+    The cache lives under the user's cache directory rather than the shared temp
+    directory, so other users cannot plant provider binaries in it. It is only
+    used when this user owns it and nobody else can write to it.
+
+    Returns:
+        Cache directory, or None when no private cache is available
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = Path(base) / 'tf-mcp-server' / 'plugin-cache'
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(path)
+        if not stat.S_ISDIR(info.st_mode):
+            raise OSError(f"{path} is not a directory")
+        if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+            raise OSError(f"{path} is not owned by the current user")
+        if info.st_mode & 0o077:
+            os.chmod(path, 0o700)
+    except OSError as e:
+        logger.warning(f"Terraform plugin cache disabled: {e}")
+        return None
+    return path
+
+
+def _strip_ansi_bytes(data: bytes) -> bytes:
+    """
+    Remove ANSI escape sequences and control bytes from raw output.
+    
+    Escape sequences are an ASCII protocol, so they are stripped before
+    decoding. The regex only runs when an ESC byte is present; control bytes,
+    including any ESC that does not start a valid sequence, are then deleted
+    with ``bytes.translate``.
+    
+    Args:
+        data: Output bytes
+        
+    Returns:
+        Output bytes without escape sequences or control characters
+    """
+    if b'\x1b' in data:
+        data = _ANSI_BYTES_RE.sub(b'', data)
+    return data.translate(None, _CTRL_BYTES)
+
+
+def _block_body(hcl_content: str, brace: int) -> Optional[str]:
+    """
+    Return the text of the block whose opening brace is at ``brace``.
+
+    Args:
+        hcl_content: HCL content
+        brace: Index of the opening ``{``
+
+    Returns:
+        Text between the braces, or None when the block is not closed
+    """
+    depth = 0
+    for index in range(brace, len(hcl_content)):
+        char = hcl_content[index]
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return hcl_content[brace + 1:index]
+    return None
+
+
+def _module_calls(hcl_content: str) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Find the module blocks in HCL content.
+
+    Args:
+        hcl_content: HCL content to inspect
+
+    Returns:
+        Mapping of module name to its (source, version) attributes
+    """
+    modules: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    for match in _MODULE_RE.finditer(hcl_content):
+        body = _block_body(hcl_content, match.end() - 1) or ''
+        source = _SOURCE_ATTR_RE.search(body)
+        version = _VERSION_ATTR_RE.search(body)
+        modules[match.group(1)] = (
+            source.group(1) if source else None,
+            version.group(1) if version else None,
+        )
+    return modules
+
+
+def _provider_address(source: str) -> str:
+    """Expand a provider source such as ``hashicorp/azurerm`` to the address used in lock files."""
+    source = source.lower()
+    return source if source.count('/') >= 2 else f'{_DEFAULT_REGISTRY}/{source}'
+
+
+def _constraint_set(constraints: str) -> frozenset:
+    """Split a version constraint string into whitespace-insensitive parts."""
+    return frozenset(''.join(part.split()) for part in constraints.split(',') if part.strip())
+
+
+def _required_providers(hcl_content: str) -> Dict[str, Optional[str]]:
+    """
+    Find the providers HCL content needs, declared or implied by resource types.
+
+    Args:
+        hcl_content: HCL content to inspect
+
+    Returns:
+        Mapping of provider address to its version constraint, if any
+    """
+    declared: Dict[str, Tuple[str, Optional[str]]] = {}
+    start = hcl_content.find('required_providers')
+    brace = hcl_content.find('{', start) if start != -1 else -1
+    body = _block_body(hcl_content, brace) if brace != -1 else None
+    for name, attrs in _REQUIRED_PROVIDER_RE.findall(body or ''):
+        source = _SOURCE_ATTR_RE.search(attrs)
+        version = _VERSION_ATTR_RE.search(attrs)
+        declared[name] = (
+            source.group(1) if source else f'hashicorp/{name}',
+            version.group(1) if version else None,
+        )
+    for name in _RESOURCE_PROVIDER_RE.findall(hcl_content):
+        declared.setdefault(name, (f'hashicorp/{name}', None))
+    # terraform_data and friends come from the built-in provider, which is never locked
+    declared.pop('terraform', None)
+    return {_provider_address(source): version for source, version in declared.values()}
+
+
+def _init_is_current(path: Path, hcl_content: str) -> bool:
+    """
+    Check whether an earlier ``terraform init`` in a directory still fits HCL content.
+
+    Every provider the config needs must be in the lock file with the config's
+    version constraints, and every module block must be installed from the same
+    source at the same version. Anything else, including files that cannot be
+    read, means init has to run again.
+
+    Args:
+        path: Working directory
+        hcl_content: HCL content written into the directory
+
+    Returns:
+        True when init can be skipped
+    """
+    if not (path / '.terraform' / 'providers').is_dir():
+        return False
+
+    required = _required_providers(hcl_content)
+    if required:
+        try:
+            lock_text = (path / _LOCKFILE_NAME).read_text('utf-8')
+        except OSError:
+            return False
+        locked = {}
+        for address, body in _LOCK_PROVIDER_RE.findall(lock_text):
+            constraints = _LOCK_CONSTRAINTS_RE.search(body)
+            locked[address.lower()] = _constraint_set(constraints.group(1) if constraints else '')
+        for address, version in required.items():
+            if address not in locked:
+                return False
+            # The lock records every module's constraints too, so the config's
+            # own constraints only need to be among them
+            if version and not _constraint_set(version) <= locked[address]:
+                return False
+
+    modules = _module_calls(hcl_content)
+    if modules:
+        try:
+            manifest = _json_loads((path / '.terraform' / 'modules' / 'modules.json').read_bytes())
+        except (OSError, ValueError):
+            return False
+        installed = {entry.get('Key'): entry for entry in manifest.get('Modules', [])}
+        for name, (source, version) in modules.items():
+            entry = installed.get(name)
+            if entry is None:
+                return False
+            if source and entry.get('Source') not in (source, f'{_DEFAULT_REGISTRY}/{source}'):
+                return False
+            if version and entry.get('Version') != version:
+                return False
+
+    return True
+
+
+def _providers_fingerprint(hcl_content: str) -> str:
+    """
+    Compute a fingerprint of the providers and modules referenced by HCL content.
+
+    Two snippets with the same fingerprint can share an initialized working
+    directory without running ``terraform init`` again.
+
+    Args:
+        hcl_content: HCL content to inspect
+
+    Returns:
+        Hex digest identifying the provider/module set
+    """
+    parts: List[str] = []
+
+    start = hcl_content.find('required_providers')
+    brace = hcl_content.find('{', start) if start != -1 else -1
+    if brace != -1:
+        body = _block_body(hcl_content, brace)
+        if body is not None:
+            parts.append(' '.join(body.split()))
+
+    parts.extend(sorted(set(_SOURCE_RE.findall(hcl_content))))
+    parts.extend(sorted(set(_RESOURCE_PROVIDER_RE.findall(hcl_content))))
+    # Installed modules live in .terraform/modules keyed by name, so the name
+    # and pinned version matter as much as the source
+    parts.extend(
+        f'module {name} {source} {version}'
+        for name, (source, version) in sorted(_module_calls(hcl_content).items())
+    )
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+class _WarmDir:
+    """A reusable Terraform working directory that keeps its initialized providers."""
+
+    def __init__(self, providers_fingerprint: str, lockfile: Optional[bytes] = None):
+        self.path = Path(tempfile.mkdtemp(prefix='tf-mcp-'))
+        self.providers_fingerprint = providers_fingerprint
+        # Set once `terraform init` succeeds; directories that never got there
+        # are deleted rather than pooled
+        self.initialized = False
+        if lockfile is not None:
+            # Pinned provider hashes let init skip version resolution
+            (self.path / _LOCKFILE_NAME).write_bytes(lockfile)
+
+    def reset(self) -> None:
+        """Remove configuration and state files while keeping `.terraform`."""
+        for entry in self.path.iterdir():
+            if entry.name in _WARM_DIR_KEEP:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+
+    def clean_tmp(self) -> None:
+        """Delete the working directory."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
 
 class TerraformExecutor:
     """Terraform HCL execution and validation utilities."""
@@ -29,55 +459,99 @@ class TerraformExecutor:
         Initialize the Terraform executor.
         
         Args:
-            max_instances: Maximum number of executor instances to maintain
+            max_instances: Maximum number of warm working directories to keep
         """
         self.max_instances = max_instances
         self.pool: asyncio.Queue = asyncio.Queue(max_instances)
-        self.lock = asyncio.Lock()
-        self._initialized = False
+        self._ready = asyncio.Event()
+        self._init_task: Optional[asyncio.Task] = None
+        self._tf_bin: Optional[str] = None
+        self._version_task: Optional[asyncio.Task] = None
+        # Provider plugin cache so `terraform init` in a fresh scratch directory
+        # links providers instead of downloading them again
+        self._plugin_cache = _private_plugin_cache_dir()
+        self._cached_lockfiles: Dict[str, bytes] = {}
     
     async def init_tf(self) -> None:
         """Initialize Terraform in a temporary directory."""
-        if self._initialized:
+        global _TF_BIN
+
+        if self._ready.is_set():
             return
         
         try:
-            # Check if Terraform is installed
-            result = await asyncio.create_subprocess_exec(
-                'terraform', 'version',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Terraform not found or not working: {stderr.decode()}")
-            
-            logger.info(f"Terraform version: {stdout.decode().strip()}")
-            self._initialized = True
+            # Resolve the binary once; the version probe only re-runs if PATH changed
+            tf_bin = shutil.which('terraform')
+            if tf_bin is None:
+                raise FileNotFoundError('terraform')
+
+            if tf_bin != _TF_BIN:
+                # The version is only logged, so probe it without delaying the first command
+                _TF_BIN = tf_bin
+                self._version_task = asyncio.create_task(self._log_terraform_version(tf_bin))
+
+            self._tf_bin = tf_bin
+            self._ready.set()
             
         except FileNotFoundError:
             raise RuntimeError("Terraform binary not found. Please install Terraform.")
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Terraform: {e}")
     
+    @staticmethod
+    async def _log_terraform_version(tf_bin: str) -> None:
+        """
+        Run `terraform version` once and log the result.
+        
+        Args:
+            tf_bin: Resolved path of the terraform binary
+        """
+        global _TF_VERSION
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                tf_bin, 'version',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate()
+        except OSError as e:
+            logger.warning(f"Could not determine Terraform version: {e}")
+            return
+        
+        if process.returncode != 0:
+            logger.warning(f"Could not determine Terraform version: {stderr.decode().strip()}")
+            return
+        
+        _TF_VERSION = stdout.decode().strip()
+        logger.info(f"Terraform version: {_TF_VERSION}")
+    
     def clean_up(self) -> None:
         """Clean up temporary resources."""
-        while not self.pool.empty():
+        while True:
             try:
                 item = self.pool.get_nowait()
-                if hasattr(item, 'clean_tmp'):
-                    item.clean_tmp()
             except asyncio.QueueEmpty:
                 break
+            clean_tmp = getattr(item, 'clean_tmp', None)
+            if clean_tmp is not None:
+                clean_tmp()
     
     @asynccontextmanager
     async def get_instance(self):
         """Get an executor instance with proper resource management."""
-        async with self.lock:
-            if not self._initialized:
-                await self.init_tf()
-            yield self
+        if not self._ready.is_set():
+            # Concurrent first callers share one init task; later calls skip straight through
+            task = self._init_task
+            if task is None:
+                task = self._init_task = asyncio.create_task(self.init_tf())
+            try:
+                await task
+            except Exception:
+                if self._init_task is task:
+                    self._init_task = None
+                raise
+        yield self
     
     async def validate_hcl(self, hcl_content: str, file_name: str = "main.tf") -> ValidationResult:
         """
@@ -102,17 +576,26 @@ class TerraformExecutor:
         if extracted_hcl:
             hcl_content = extracted_hcl
         
-        # Create temporary directory for validation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            tf_file = temp_path / file_name
+        async with self._warm_dir(hcl_content) as warm:
+            tf_file = warm.path / file_name
             
             try:
-                # Write HCL content to temporary file
-                tf_file.write_text(hcl_content, encoding='utf-8')
+                # Write HCL content to the working directory
+                await asyncio.to_thread(tf_file.write_text, hcl_content, 'utf-8')
+
+                # Providers only need installing the first time a directory is used
+                init_result = await self._ensure_initialized(warm.path, hcl_content)
+                warm.initialized = init_result['exit_code'] == 0
+                if not warm.initialized:
+                    return ValidationResult(
+                        is_valid=False,
+                        errors=self._parse_terraform_errors(init_result['stderr']),
+                        file_path=str(tf_file)
+                    )
+                self._remember_lockfile(warm)
                 
                 # Run terraform validate
-                result = await self._run_terraform_command(['validate'], str(temp_path))
+                result = await self._run_terraform_command(_VALIDATE_CMD, str(warm.path))
                 
                 if result['exit_code'] == 0:
                     return ValidationResult(
@@ -135,8 +618,101 @@ class TerraformExecutor:
                     errors=[f"Validation error: {str(e)}"],
                     file_path=str(tf_file)
                 )
+
+    async def _ensure_initialized(self, path: Path, hcl_content: str) -> Dict[str, Any]:
+        """
+        Run ``terraform init`` in a directory unless an earlier init still fits the HCL.
+        
+        Args:
+            path: Working directory to initialize
+            hcl_content: HCL content written into the directory
+            
+        Returns:
+            Init result, or a synthetic success result when init was skipped
+        """
+        if await asyncio.to_thread(_init_is_current, path, hcl_content):
+            return {
+                'exit_code': 0,
+                'stdout': '',
+                'stderr': '',
+                'command': 'terraform init',
+                'status': 'success'
+            }
+        return await self._run_terraform_command(_INIT_VALIDATE_CMD, str(path), plugin_cache=True)
+    
+    async def validate_hcl_batch(self, hcl_contents: List[str], file_name: str = "main.tf") -> List[ValidationResult]:
+        """
+        Validate several independent HCL snippets concurrently.
+        
+        At most ``max_instances`` validations run at once, matching the size of
+        the warm working directory pool.
+        
+        Args:
+            hcl_contents: HCL contents to validate
+            file_name: Name for each temporary file
+            
+        Returns:
+            ValidationResults in the same order as ``hcl_contents``
+        """
+        semaphore = asyncio.Semaphore(self.max_instances)
+        
+        async def _validate_one(hcl_content: str) -> ValidationResult:
+            async with semaphore:
+                return await self.validate_hcl(hcl_content, file_name)
+        
+        return list(await asyncio.gather(*(_validate_one(hcl) for hcl in hcl_contents)))
+
+    @asynccontextmanager
+    async def _warm_dir(self, hcl_content: str):
+        """
+        Borrow a working directory already initialized for the providers in the HCL.
+
+        Initialized directories are returned to ``self.pool`` afterwards; when
+        init failed or the pool is full the directory is deleted instead.
+
+        Args:
+            hcl_content: HCL content that will be written into the directory
+        """
+        fingerprint = _providers_fingerprint(hcl_content)
+        warm = None
+        for _ in range(self.pool.qsize()):
+            candidate = self.pool.get_nowait()
+            if warm is None and candidate.providers_fingerprint == fingerprint:
+                warm = candidate
+            else:
+                self.pool.put_nowait(candidate)
+        if warm is None:
+            warm = _WarmDir(fingerprint, self._cached_lockfiles.get(fingerprint))
+        
+        try:
+            yield warm
+        finally:
+            if not warm.initialized:
+                await asyncio.to_thread(warm.clean_tmp)
+            else:
+                await asyncio.to_thread(warm.reset)
+                try:
+                    self.pool.put_nowait(warm)
+                except asyncio.QueueFull:
+                    warm.clean_tmp()
     
-    async def plan_terraform(self, working_dir: str, var_file: Optional[str] = None, strip_ansi: bool = True) -> Dict[str, Any]:
+    def _remember_lockfile(self, warm: _WarmDir) -> None:
+        """
+        Keep the lock file from the first successful init for each provider set.
+
+        Lock files pin provider versions, so they are only shared between
+        directories with the same providers fingerprint.
+
+        Args:
+            warm: Working directory that has just been initialized
+        """
+        if warm.providers_fingerprint in self._cached_lockfiles:
+            return
+        lockfile = warm.path / _LOCKFILE_NAME
+        if lockfile.is_file():
+            self._cached_lockfiles[warm.providers_fingerprint] = lockfile.read_bytes()
+    
+    async def plan_terraform(self, working_dir: str, var_file: Optional[str] = None, strip_ansi: bool = True, parallelism: Optional[int] = None, refresh: bool = True) -> Dict[str, Any]:
         """
         Run terraform plan in the specified directory.
         
@@ -144,14 +720,23 @@ class TerraformExecutor:
             working_dir: Directory containing Terraform files
             var_file: Optional variables file
             strip_ansi: Whether to clean ANSI codes from output
+            parallelism: Optional limit on concurrent provider operations (Terraform default is 10)
+            refresh: Whether to refresh state against the cloud APIs first; disabling it makes
+                plans of large configs much faster but they may miss out-of-band drift
             
         Returns:
             Plan execution result
         """
-        cmd = ['plan', '-no-color', '-detailed-exitcode']
+        cmd: Tuple[str, ...] = _PLAN_CMD
         
         if var_file:
-            cmd.extend(['-var-file', var_file])
+            cmd += ('-var-file', var_file)
+        
+        if parallelism:
+            cmd += (f'-parallelism={parallelism}',)
+        
+        if not refresh:
+            cmd += ('-refresh=false',)
         
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
@@ -167,12 +752,12 @@ class TerraformExecutor:
         Returns:
             Initialization result
         """
-        cmd = ['init', '-no-color']
+        cmd: Tuple[str, ...] = _INIT_CMD
         if upgrade:
-            cmd.append('-upgrade')
+            cmd += ('-upgrade',)
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
-    async def apply_terraform(self, working_dir: str, var_file: Optional[str] = None, auto_approve: bool = False, strip_ansi: bool = True) -> Dict[str, Any]:
+    async def apply_terraform(self, working_dir: str, var_file: Optional[str] = None, auto_approve: bool = False, strip_ansi: bool = True, parallelism: Optional[int] = None) -> Dict[str, Any]:
         """
         Run terraform apply in the specified directory.
         
@@ -181,21 +766,25 @@ class TerraformExecutor:
             var_file: Optional variables file
             auto_approve: Whether to automatically approve the apply
             strip_ansi: Whether to clean ANSI codes from output
+            parallelism: Optional limit on concurrent provider operations (Terraform default is 10)
             
         Returns:
             Apply execution result
         """
-        cmd = ['apply', '-no-color']
+        cmd: Tuple[str, ...] = _APPLY_CMD
         
         if auto_approve:
-            cmd.append('-auto-approve')
+            cmd += ('-auto-approve',)
         
         if var_file:
-            cmd.extend(['-var-file', var_file])
+            cmd += ('-var-file', var_file)
+        
+        if parallelism:
+            cmd += (f'-parallelism={parallelism}',)
         
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
-    async def destroy_terraform(self, working_dir: str, var_file: Optional[str] = None, auto_approve: bool = False, strip_ansi: bool = True) -> Dict[str, Any]:
+    async def destroy_terraform(self, working_dir: str, var_file: Optional[str] = None, auto_approve: bool = False, strip_ansi: bool = True, parallelism: Optional[int] = None) -> Dict[str, Any]:
         """
         Run terraform destroy in the specified directory.
         
@@ -204,21 +793,25 @@ class TerraformExecutor:
             var_file: Optional variables file
             auto_approve: Whether to automatically approve the destroy
             strip_ansi: Whether to clean ANSI codes from output
+            parallelism: Optional limit on concurrent provider operations (Terraform default is 10)
             
         Returns:
             Destroy execution result
         """
-        cmd = ['destroy', '-no-color']
+        cmd: Tuple[str, ...] = _DESTROY_CMD
         
         if auto_approve:
-            cmd.append('-auto-approve')
+            cmd += ('-auto-approve',)
         
         if var_file:
-            cmd.extend(['-var-file', var_file])
+            cmd += ('-var-file', var_file)
+        
+        if parallelism:
+            cmd += (f'-parallelism={parallelism}',)
         
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
-    async def refresh_terraform(self, working_dir: str, var_file: Optional[str] = None, strip_ansi: bool = True) -> Dict[str, Any]:
+    async def refresh_terraform(self, working_dir: str, var_file: Optional[str] = None, strip_ansi: bool = True, parallelism: Optional[int] = None) -> Dict[str, Any]:
         """
         Run terraform refresh in the specified directory.
         
@@ -226,14 +819,18 @@ class TerraformExecutor:
             working_dir: Directory containing Terraform files
             var_file: Optional variables file
             strip_ansi: Whether to clean ANSI codes from output
+            parallelism: Optional limit on concurrent provider operations (Terraform default is 10)
             
         Returns:
             Refresh execution result
         """
-        cmd = ['refresh', '-no-color']
+        cmd: Tuple[str, ...] = _REFRESH_CMD
         
         if var_file:
-            cmd.extend(['-var-file', var_file])
+            cmd += ('-var-file', var_file)
+        
+        if parallelism:
+            cmd += (f'-parallelism={parallelism}',)
         
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
@@ -249,10 +846,10 @@ class TerraformExecutor:
         Returns:
             Show execution result
         """
-        cmd = ['show', '-no-color']
+        cmd: Tuple[str, ...] = _SHOW_CMD
         
         if state_file:
-            cmd.append(state_file)
+            cmd += (state_file,)
         
         return await self._run_terraform_command(cmd, working_dir, strip_ansi)
     
@@ -269,20 +866,20 @@ class TerraformExecutor:
         Returns:
             Output execution result with parsed outputs if JSON format
         """
-        cmd = ['output', '-no-color']
+        cmd: Tuple[str, ...] = _OUTPUT_CMD
         
         if json_format:
-            cmd.append('-json')
+            cmd += ('-json',)
         
         if output_name:
-            cmd.append(output_name)
+            cmd += (output_name,)
         
         result = await self._run_terraform_command(cmd, working_dir, strip_ansi)
         
         # Parse JSON outputs if requested and successful
         if json_format and result['exit_code'] == 0 and result['stdout']:
             try:
-                raw_outputs = json.loads(result['stdout'])
+                raw_outputs = _json_loads(result['stdout'])
                 processed_outputs = {}
                 
                 for key, value in raw_outputs.items():
@@ -312,7 +909,7 @@ class TerraformExecutor:
         Returns:
             Workspace list result
         """
-        return await self._run_terraform_command(['workspace', 'list'], working_dir, strip_ansi)
+        return await self._run_terraform_command(_WORKSPACE_LIST_CMD, working_dir, strip_ansi)
     
     async def workspace_select(self, working_dir: str, workspace_name: str, strip_ansi: bool = True) -> Dict[str, Any]:
         """
@@ -326,7 +923,7 @@ class TerraformExecutor:
         Returns:
             Workspace selection result
         """
-        return await self._run_terraform_command(['workspace', 'select', workspace_name], working_dir, strip_ansi)
+        return await self._run_terraform_command((*_WORKSPACE_SELECT_CMD, workspace_name), working_dir, strip_ansi)
     
     async def workspace_new(self, working_dir: str, workspace_name: str, strip_ansi: bool = True) -> Dict[str, Any]:
         """
@@ -340,7 +937,7 @@ class TerraformExecutor:
         Returns:
             Workspace creation result
         """
-        return await self._run_terraform_command(['workspace', 'new', workspace_name], working_dir, strip_ansi)
+        return await self._run_terraform_command((*_WORKSPACE_NEW_CMD, workspace_name), working_dir, strip_ansi)
 
     async def execute_in_workspace(
         self, 
@@ -368,24 +965,13 @@ class TerraformExecutor:
         base_command = cmd_parts[0] if cmd_parts else command
         
         # Handle common command-specific options
-        if base_command == 'plan':
-            if kwargs.get('var_file'):
-                cmd_parts.extend(['-var-file', kwargs['var_file']])
-            if kwargs.get('detailed_exitcode'):
-                cmd_parts.append('-detailed-exitcode')
-        elif base_command == 'apply':
-            if kwargs.get('var_file'):
-                cmd_parts.extend(['-var-file', kwargs['var_file']])
-            if kwargs.get('auto_approve'):
-                cmd_parts.append('-auto-approve')
-        elif base_command == 'destroy':
-            if kwargs.get('var_file'):
-                cmd_parts.extend(['-var-file', kwargs['var_file']])
-            if kwargs.get('auto_approve'):
-                cmd_parts.append('-auto-approve')
-        elif base_command == 'init':
-            if kwargs.get('upgrade'):
-                cmd_parts.append('-upgrade')
+        if base_command in _PARALLELISM_COMMANDS and kwargs.get('parallelism'):
+            # Higher values speed up provider-heavy configs but some APIs throttle above ~5-10
+            cmd_parts.append(f"-parallelism={kwargs['parallelism']}")
+        
+        options = _COMMAND_OPTIONS.get(base_command)
+        if options is not None:
+            cmd_parts.extend(options(kwargs))
         
         # Add no-color flag for most commands (unless explicitly disabled)
         if not kwargs.get('allow_color', False):
@@ -406,50 +992,40 @@ class TerraformExecutor:
         if not text:
             return text
 
-        # First remove ANSI escape sequences (color codes, cursor movement)
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        text = ansi_escape.sub('', text)
-
-        # Remove C0 and C1 control characters (except common whitespace)
-        control_chars = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
-        text = control_chars.sub('', text)
-
-        # Replace HTML entities
-        html_entities = {
-            '-&gt;': '->',  # Replace HTML arrow
-            '&lt;': '<',  # Less than
-            '&gt;': '>',  # Greater than
-            '&amp;': '&',  # Ampersand
-        }
-        for entity, replacement in html_entities.items():
-            text = text.replace(entity, replacement)
-
-        # Replace box-drawing and other special Unicode characters with ASCII equivalents
-        unicode_chars = {
-            '\u2500': '-',  # Horizontal line
-            '\u2502': '|',  # Vertical line
-            '\u2514': '+',  # Up and right
-            '\u2518': '+',  # Up and left
-            '\u2551': '|',  # Double vertical
-            '\u2550': '-',  # Double horizontal
-            '\u2554': '+',  # Double down and right
-            '\u2557': '+',  # Double down and left
-            '\u255a': '+',  # Double up and right
-            '\u255d': '+',  # Double up and left
-            '\u256c': '+',  # Double cross
-            '\u2588': '#',  # Full block
-            '\u25cf': '*',  # Black circle
-            '\u2574': '-',  # Left box drawing
-            '\u2576': '-',  # Right box drawing
-            '\u2577': '|',  # Down box drawing
-            '\u2575': '|',  # Up box drawing
-        }
-        for char, replacement in unicode_chars.items():
-            text = text.replace(char, replacement)
-
-        return text
-
-    async def _run_terraform_command(self, cmd: List[str], working_dir: str, strip_ansi: bool = True) -> Dict[str, Any]:
+        # Remove ANSI escape sequences (color codes, cursor movement); with
+        # -no-color there usually are none, so skip the regex when ESC is absent
+        if '\x1b' in text:
+            text = _ANSI_RE.sub('', text)
+
+        # Drop control characters and replace box-drawing characters
+        if text.isascii():
+            text = text.translate(_UNICODE_TABLE)
+        else:
+            for source, target in zip(_UNICODE_SOURCES, _UNICODE_TARGETS):
+                if source in text:
+                    text = text.replace(source, target)
+
+        # Replace HTML entities in one pass; every entity starts with '&'
+        if '&' not in text:
+            return text
+        return _HTML_ENTITY_RE.sub(lambda match: _HTML_ENTITIES[match.group()], text)
+
+    async def _clean_output_text_async(self, text: str) -> str:
+        """
+        Clean output text, moving large outputs off the event loop.
+        
+        Args:
+            text: The text to clean
+            
+        Returns:
+            Cleaned text with ASCII-friendly replacements
+        """
+        if len(text) < _THREAD_CLEAN_SIZE:
+            return self._clean_output_text(text)
+        # Multi-megabyte plan/apply output would otherwise stall other requests
+        return await asyncio.to_thread(self._clean_output_text, text)
+
+    async def _run_terraform_command(self, cmd: Sequence[str], working_dir: str, strip_ansi: bool = True, plugin_cache: bool = False) -> Dict[str, Any]:
         """
         Run a Terraform command in the specified directory.
         
@@ -457,31 +1033,46 @@ class TerraformExecutor:
             cmd: Terraform command and arguments
             working_dir: Working directory for the command
             strip_ansi: Whether to clean ANSI codes and Unicode from output
+            plugin_cache: Point Terraform at the executor's private plugin cache;
+                only for the executor's own scratch directories, never user workspaces
             
         Returns:
             Command execution result with structured output
         """
-        full_cmd = ['terraform'] + cmd
+        full_cmd = ['terraform', *cmd]
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *full_cmd,
-                cwd=working_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            # A plugin cache configured by the user takes precedence over ours
+            env = None
+            if plugin_cache and self._plugin_cache is not None and 'TF_PLUGIN_CACHE_DIR' not in os.environ:
+                env = {**os.environ, 'TF_PLUGIN_CACHE_DIR': str(self._plugin_cache)}
             
-            # Decode output
-            stdout_text = stdout.decode('utf-8')
-            stderr_text = stderr.decode('utf-8') if stderr else ''
+            if strip_ansi:
+                process = await self._spawn(cmd, working_dir, env, asyncio.subprocess.PIPE, asyncio.subprocess.PIPE)
+                
+                # Drain both pipes while the process runs so Terraform never blocks on a full pipe
+                stdout, stderr, _ = await asyncio.gather(
+                    self._drain_stream(process.stdout, strip_ansi),
+                    self._drain_stream(process.stderr, strip_ansi),
+                    process.wait()
+                )
+                
+                # Decode output
+                stdout_text = stdout.decode('utf-8')
+                stderr_text = stderr.decode('utf-8') if stderr else ''
+            else:
+                # Raw output needs no processing while Terraform runs, so let it write
+                # straight into anonymous files instead of through pipes
+                with _open_output_file('tf-stdout') as stdout_file, _open_output_file('tf-stderr') as stderr_file:
+                    process = await self._spawn(cmd, working_dir, env, stdout_file, stderr_file)
+                    await process.wait()
+                    stdout_text = _read_output_file(stdout_file)
+                    stderr_text = _read_output_file(stderr_file)
             
             # Clean output text if requested
             if strip_ansi:
-                logger.debug('Cleaning command output text (ANSI codes and control characters)')
-                stdout_text = self._clean_output_text(stdout_text)
-                stderr_text = self._clean_output_text(stderr_text)
+                stdout_text = await self._clean_output_text_async(stdout_text)
+                stderr_text = await self._clean_output_text_async(stderr_text)
             
             return {
                 'exit_code': process.returncode,
@@ -501,6 +1092,73 @@ class TerraformExecutor:
                 'status': 'error'
             }
     
+    async def _spawn(self, cmd: Sequence[str], working_dir: str, env: Optional[Dict[str, str]], stdout: Any, stderr: Any) -> Process:
+        """
+        Start a Terraform subprocess.
+        
+        Args:
+            cmd: Terraform command and arguments
+            working_dir: Working directory for the command
+            env: Environment for the child, or None to inherit
+            stdout: Destination for the child's stdout
+            stderr: Destination for the child's stderr
+            
+        Returns:
+            The started process
+        """
+        # Exec the resolved binary directly to skip the PATH walk in the child.
+        # Without preexec_fn/user/group options CPython starts the child with
+        # vfork, so the server's page tables are not copied; keep it that way.
+        return await asyncio.create_subprocess_exec(
+            self._tf_bin or 'terraform', *cmd,
+            cwd=working_dir,
+            env=env,
+            stdout=stdout,
+            stderr=stderr,
+            close_fds=True
+        )
+    
+    @staticmethod
+    async def _drain_stream(stream: asyncio.StreamReader, strip_ansi: bool) -> bytearray:
+        """
+        Read a subprocess pipe to EOF in chunks.
+        
+        When ``strip_ansi`` is set, ANSI escape sequences and C0 control bytes
+        are removed from each complete line as it arrives; escape sequences never
+        span a newline, so holding back only the trailing partial line keeps
+        chunk boundaries safe.
+        
+        Args:
+            stream: Subprocess stdout or stderr reader
+            strip_ansi: Whether to strip ANSI escape sequences while reading
+            
+        Returns:
+            Collected output bytes
+        """
+        output = bytearray()
+        pending = bytearray()
+        
+        while True:
+            chunk = await stream.read(_READ_CHUNK)
+            if not chunk:
+                break
+            if not strip_ansi:
+                output += chunk
+                continue
+            # Only the new chunk is searched, so a long line without newlines
+            # (e.g. `terraform show -json`) is extended in place, not recopied
+            cut = chunk.rfind(b'\n') + 1
+            if not cut:
+                pending += chunk
+                continue
+            pending += chunk[:cut]
+            output += _strip_ansi_bytes(pending)
+            pending[:] = chunk[cut:]
+        
+        if pending:
+            output += _strip_ansi_bytes(pending)
+        return output
+    
     def _parse_terraform_errors(self, stderr: str) -> List[str]:
         """
         Parse Terraform error output into structured messages.
@@ -516,33 +1174,40 @@ class TerraformExecutor:
         if not stderr:
             return errors
         
-        # Try to parse as JSON first (newer Terraform versions)
-        try:
-            lines = stderr.strip().split('\n')
-            for line in lines:
-                if line.startswith('{'):
-                    error_data = json.loads(line)
-                    if error_data.get('@level') == 'error':
-                        message = error_data.get('@message', 'Unknown error')
-                        errors.append(message)
-        except (json.JSONDecodeError, ValueError):
-            # Fall back to text parsing
-            lines = stderr.strip().split('\n')
+        # Newer Terraform versions emit one JSON object per line; decide once
+        if stderr.lstrip().startswith('{'):
+            for line in stderr.splitlines():
+                if not line.startswith('{'):
+                    continue
+                try:
+                    error_data = _json_loads(line)
+                except ValueError:
+                    # Skip a malformed line rather than abandoning the rest
+                    continue
+                if error_data.get('@level') == 'error':
+                    errors.append(error_data.get('@message', 'Unknown error'))
+        elif 'Error:' not in stderr and '╷' not in stderr:
+            # Nothing for the text parser to group; the raw stderr is the message
+            stripped = stderr.strip()
+            return [stripped] if stripped else errors
+        else:
             current_error = []
             
-            for line in lines:
+            for line in stderr.splitlines():
                 line = line.strip()
-                if line.startswith('Error:') or line.startswith('╷'):
+                head = line[:1]
+                if head == '╷' or (head == 'E' and line.startswith('Error:')):
                     if current_error:
                         errors.append('\n'.join(current_error))
                         current_error = []
-                    if not line.startswith('╷'):
+                    if head == 'E':
                         current_error.append(line)
+                elif head == '╵':
+                    if current_error:
+                        errors.append('\n'.join(current_error))
+                        current_error = []
                 elif line and current_error:
                     current_error.append(line)
-                elif line.startswith('╵') and current_error:
-                    errors.append('\n'.join(current_error))
-                    current_error = []
             
             # Add any remaining error
             if current_error:
@@ -564,10 +1229,12 @@ _executor_instance: Optional[TerraformExecutor] = None
 async def get_terraform_executor():
     """Get the global Terraform executor instance."""
     global _executor_instance
+    # The lock only guards construction; commands themselves run concurrently
     async with _executor_lock:
         if _executor_instance is None:
             _executor_instance = TerraformExecutor()
-            await _executor_instance.init_tf()
-        
-        async with _executor_instance.get_instance() as executor:
-            yield executor
+            # Warm working directories outlive individual calls; remove them on exit
+            atexit.register(_executor_instance.clean_up)
+    
+    async with _executor_instance.get_instance() as executor:
+        yield executor
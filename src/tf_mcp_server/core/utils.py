@@ -6,10 +6,35 @@ import os
 import re
 import logging
 from functools import lru_cache
-from typing import List, Dict, Any, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from pathlib import Path
 
 
+# Pattern to match ANSI escape sequences
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Azure naming rules used by validate_azure_name
+_NAME_RE = re.compile(r'^[a-zA-Z0-9\-_]+$')
+_STORAGE_NAME_RE = re.compile(r'^[a-z0-9]+$')
+_KV_NAME_RE = re.compile(r'^[a-zA-Z0-9\-]+$')
+
+# Resource-specific rules: (label, max length, pattern, allowed characters).
+# Every specific pattern accepts a subset of _NAME_RE.
+_STORAGE_NAME_RULE = ("Storage account", 24, _STORAGE_NAME_RE, "lowercase letters and numbers")
+_KV_NAME_RULE = ("Key Vault", 24, _KV_NAME_RE, "letters, numbers, and hyphens")
+_NAME_RULES = {
+    'storage_account': _STORAGE_NAME_RULE,
+    'azurerm_storage_account': _STORAGE_NAME_RULE,
+    'key_vault': _KV_NAME_RULE,
+    'azurerm_key_vault': _KV_NAME_RULE,
+}
+
+# Characters that are invalid in file names on common filesystems, mapped to
+# '_'. A list indexed by code point is cheaper for str.translate than a dict;
+# non-ASCII characters raise IndexError and are left unchanged.
+_UNSAFE_FS_TABLE = ['_' if chr(i) in '<>:"/\\|?*' else chr(i) for i in range(128)]
+
+
 def strip_ansi_escape_sequences(text: Optional[str]) -> Optional[str]:
     """
     Remove ANSI escape sequences from text.
@@ -20,12 +45,10 @@ def strip_ansi_escape_sequences(text: Optional[str]) -> Optional[str]:
     Returns:
         Text with ANSI escape sequences removed
     """
-    if not text:
+    if not text or '\x1b' not in text:
         return text
     
-    # Pattern to match ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _ANSI_ESCAPE_RE.sub('', text)
 
 
 # Configure logging
@@ -36,35 +59,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
 def extract_hcl_from_markdown(content: str) -> str:
     """
     Extract HCL code from markdown code blocks.
     
+    Results are memoized since the same content is typically submitted
+    repeatedly while iterating on a configuration.
+    
     Args:
         content: Markdown content that may contain HCL code blocks
         
     Returns:
         Extracted HCL content
     """
-    if not content:
+    if not content or '```' not in content:
         return ""
     
-    lines = content.split('\n')
-    hcl_content = []
-    in_hcl_block = False
+    # Jump between fence lines with str.find instead of walking every line.
+    # Block text is collected as "line\n" runs and joined at the end.
+    segments = []
+    block_start = None
+    search = 0
     
-    for line in lines:
-        line_stripped = line.strip()
-        if line_stripped.startswith('```hcl') or line_stripped.startswith('```terraform'):
-            in_hcl_block = True
-            continue
-        elif line_stripped == '```' and in_hcl_block:
-            in_hcl_block = False
+    while True:
+        fence = content.find('```', search)
+        if fence == -1:
+            break
+        
+        line_start = content.rfind('\n', 0, fence) + 1
+        line_end = content.find('\n', fence)
+        if line_end == -1:
+            line_end = len(content)
+        search = line_end
+        
+        # Only fences that start their line (after indentation) are significant
+        if content[line_start:fence].strip():
             continue
-        elif in_hcl_block:
-            hcl_content.append(line)
+        
+        line_stripped = content[fence:line_end].rstrip()
+        is_opener = line_stripped.startswith('```hcl') or line_stripped.startswith('```terraform')
+        if block_start is None:
+            if is_opener:
+                block_start = line_end + 1
+        elif is_opener or line_stripped == '```':
+            segments.append(content[block_start:line_start])
+            block_start = line_end + 1 if is_opener else None
     
-    return '\n'.join(hcl_content)
+    hcl_content = ''.join(segments)
+    if block_start is not None and block_start <= len(content):
+        # Unterminated block runs to the end of the content
+        return hcl_content + content[block_start:]
+    return hcl_content[:-1]
 
 
 def extract_error_messages(validation_result: Dict[str, Any]) -> List[str]:
@@ -109,6 +155,7 @@ def extract_error_messages(validation_result: Dict[str, Any]) -> List[str]:
     return error_messages
 
 
+@lru_cache(maxsize=512)
 def normalize_resource_type(resource_type: str) -> str:
     """
     Normalize Azure resource type for documentation lookup.
@@ -144,32 +191,80 @@ def validate_azure_name(name: str, resource_type: str) -> List[str]:
         errors.append("Resource name cannot be empty")
         return errors
     
-    if len(name) < 1:
-        errors.append("Resource name must be at least 1 character long")
-    
     if len(name) > 80:  # Most Azure resources have this limit
         errors.append("Resource name cannot exceed 80 characters")
     
+    rule = _NAME_RULES.get(resource_type)
+    # A name matching the stricter resource-specific pattern also satisfies
+    # the generic one, so the generic scan only runs when that one fails.
+    specific_ok = rule is not None and rule[2].match(name) is not None
+    
     # Check for valid characters (alphanumeric, hyphens, underscores)
-    if not re.match(r'^[a-zA-Z0-9\-_]+$', name):
-        errors.append("Resource name can only contain letters, numbers, hyphens, and underscores")
+    if not specific_ok:
+        if not _NAME_RE.match(name):
+            errors.append("Resource name can only contain letters, numbers, hyphens, and underscores")
     
     # Resource-specific rules
-    if resource_type in ['storage_account', 'azurerm_storage_account']:
-        if len(name) > 24:
-            errors.append("Storage account name cannot exceed 24 characters")
-        if not re.match(r'^[a-z0-9]+$', name):
-            errors.append("Storage account name can only contain lowercase letters and numbers")
-    
-    elif resource_type in ['key_vault', 'azurerm_key_vault']:
-        if len(name) > 24:
-            errors.append("Key Vault name cannot exceed 24 characters")
-        if not re.match(r'^[a-zA-Z0-9\-]+$', name):
-            errors.append("Key Vault name can only contain letters, numbers, and hyphens")
+    if rule is not None:
+        label, max_length, _, allowed = rule
+        if len(name) > max_length:
+            errors.append(f"{label} name cannot exceed {max_length} characters")
+        if not specific_ok:
+            errors.append(f"{label} name can only contain {allowed}")
     
     return errors
 
 
+def _format_str_attribute(key: str, value: Any, indent_str: str) -> str:
+    return f'{indent_str}  {key} = "{value}"'
+
+
+def _format_bool_attribute(key: str, value: Any, indent_str: str) -> str:
+    return f'{indent_str}  {key} = {str(value).lower()}'
+
+
+def _format_plain_attribute(key: str, value: Any, indent_str: str) -> str:
+    return f'{indent_str}  {key} = {value}'
+
+
+def _format_list_attribute(key: str, value: Any, indent_str: str) -> str:
+    if all(isinstance(item, str) for item in value):
+        formatted_list = ', '.join(f'"{item}"' for item in value)
+        return f'{indent_str}  {key} = [{formatted_list}]'
+    return f'{indent_str}  {key} = {value}'
+
+
+def _format_dict_attribute(key: str, value: Any, indent_str: str) -> str:
+    lines = [f'{indent_str}  {key} = {{']
+    for sub_key, sub_value in value.items():
+        if isinstance(sub_value, str):
+            lines.append(f'{indent_str}    {sub_key} = "{sub_value}"')
+        else:
+            lines.append(f'{indent_str}    {sub_key} = {sub_value}')
+    lines.append(f'{indent_str}  }}')
+    return '\n'.join(lines)
+
+
+# Attribute formatters keyed by exact value type, in isinstance precedence order
+# (bool before int, since bool subclasses int)
+_ATTRIBUTE_FORMATTERS: Dict[type, Callable[[str, Any, str], str]] = {
+    str: _format_str_attribute,
+    bool: _format_bool_attribute,
+    int: _format_plain_attribute,
+    float: _format_plain_attribute,
+    list: _format_list_attribute,
+    dict: _format_dict_attribute,
+}
+
+
+def _attribute_formatter_for_subclass(value: Any) -> Callable[[str, Any, str], str]:
+    """Find the formatter for a value whose exact type is not in the table (e.g. a str enum)."""
+    for base, formatter in _ATTRIBUTE_FORMATTERS.items():
+        if isinstance(value, base):
+            return formatter
+    return _format_plain_attribute
+
+
 def format_terraform_block(resource_type: str, resource_name: str, 
                           attributes: Dict[str, Any], indent: int = 0) -> str:
     """
@@ -188,28 +283,8 @@ def format_terraform_block(resource_type: str, resource_name: str,
     lines = [f'{indent_str}resource "{resource_type}" "{resource_name}" {{']
     
     for key, value in attributes.items():
-        if isinstance(value, str):
-            lines.append(f'{indent_str}  {key} = "{value}"')
-        elif isinstance(value, bool):
-            lines.append(f'{indent_str}  {key} = {str(value).lower()}')
-        elif isinstance(value, (int, float)):
-            lines.append(f'{indent_str}  {key} = {value}')
-        elif isinstance(value, list):
-            if all(isinstance(item, str) for item in value):
-                formatted_list = ', '.join(f'"{item}"' for item in value)
-                lines.append(f'{indent_str}  {key} = [{formatted_list}]')
-            else:
-                lines.append(f'{indent_str}  {key} = {value}')
-        elif isinstance(value, dict):
-            lines.append(f'{indent_str}  {key} = {{')
-            for sub_key, sub_value in value.items():
-                if isinstance(sub_value, str):
-                    lines.append(f'{indent_str}    {sub_key} = "{sub_value}"')
-                else:
-                    lines.append(f'{indent_str}    {sub_key} = {sub_value}')
-            lines.append(f'{indent_str}  }}')
-        else:
-            lines.append(f'{indent_str}  {key} = {value}')
+        formatter = _ATTRIBUTE_FORMATTERS.get(type(value)) or _attribute_formatter_for_subclass(value)
+        lines.append(formatter(key, value, indent_str))
     
     lines.append(f'{indent_str}}}')
     return '\n'.join(lines)
@@ -297,7 +372,7 @@ def safe_filename(filename: str) -> str:
         Safe filename for filesystem use
     """
     # Replace invalid characters with underscores
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    safe_name = filename.translate(_UNSAFE_FS_TABLE)
     # Remove any trailing dots or spaces
     safe_name = safe_name.rstrip('. ')
     # Ensure it's not empty
@@ -373,7 +448,8 @@ def resolve_workspace_path(
         ValueError: If an absolute path outside the workspace root is provided
                     while ``allow_external_absolute`` is False.
     """
-    workspace_root = get_workspace_root().resolve(strict=False)
+    # get_workspace_root already returns a resolved path and is cached
+    workspace_root = get_workspace_root()
 
     if not path_like or (isinstance(path_like, str) and not path_like.strip()):
         return workspace_root
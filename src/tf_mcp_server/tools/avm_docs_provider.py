@@ -11,7 +11,14 @@ import requests
 import shutil
 import tarfile
 import time
-import uuid
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from ..core.config import Config
 
@@ -22,6 +29,12 @@ class Constants:
     LOCAL_DATA_BASE_PATH = "__avm_data_cache__"
     AVAILABLE_MODULE_FILE = "available_modules.csv"
     CACHE_EXPIRATION_SECONDS = 86400  # 24 hours
+
+    # HTTP connection pooling and retries for GitHub requests
+    HTTP_POOL_SIZE = 16
+    HTTP_RETRY_TOTAL = 3
+    HTTP_RETRY_BACKOFF_FACTOR = 0.5
+    HTTP_RETRY_STATUSES = (429, 502, 503, 504)
     
     # Module CSV columns
     MODULE_NAME_COLUMN = "ModuleName"
@@ -57,13 +70,41 @@ def raise_unexpected_exception(message: str):
     logger.error(message)
     raise UnexpectedException(message)
 
+def dumps_json(value, pretty: bool = False) -> str:
+    # Tool results are read by clients rather than people, so they are compact by default
+    if pretty:
+        return json.dumps(value, indent=2)
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+def create_http_session() -> requests.Session:
+    # Reuse TCP/TLS connections across GitHub requests and retry transient failures.
+    # The final response is still returned on exhausted retries so raise_for_status reports it.
+    retry = Retry(
+        total=Constants.HTTP_RETRY_TOTAL,
+        backoff_factor=Constants.HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=Constants.HTTP_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=Constants.HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
 class AzureVerifiedModuleDocumentationProvider:
+    _session: requests.Session = create_http_session()
+
     def __init__(self):
         os.makedirs(Constants.LOCAL_DATA_BASE_PATH, exist_ok=True)
         self._available_modules: dict[str, dict] = None
+        self._cache_loaded_at: float = 0.0
+        self._available_modules_etag: str = None
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_header() -> dict[str, str]:
+        # Built once per process; _raise_for_status clears it on 401 so a rotated token is picked up
         result = {
             "Accept": "application/vnd.github.v3+json",
             "X-GitHub-Api-Version": "2022-11-28",
@@ -79,6 +120,12 @@ class AzureVerifiedModuleDocumentationProvider:
         return result
 
     
+    @staticmethod
+    def _raise_for_status(response: requests.Response) -> None:
+        if response.status_code == 401:
+            AzureVerifiedModuleDocumentationProvider._get_header.cache_clear()
+        response.raise_for_status()
+
     @staticmethod
     def _source_from_repo_url(repo_url: str) -> str:
         # Split https://github.com/Azure/terraform-azurerm-avm-res-apimanagement-service to get: ['https://github.com', 'Azure', 'terraform-azurerm-avm-res-apimanagement-service']
@@ -88,47 +135,72 @@ class AzureVerifiedModuleDocumentationProvider:
         # Return format: "Azure/avm-res-apimanagement-service/azurerm"
         return f"{github_org}/{module_name}/{module_org}"
     
+    @staticmethod
+    def _strip_top_level_directory(tar: tarfile.TarFile):
+        # GitHub tarballs wrap everything in a single "<org>-<repo>-<sha>/" directory.
+        # Rename members while streaming so files land directly in the target path.
+        prefix = None
+        for member in tar:
+            if prefix is None:
+                top_level = member.name.split('/', 1)[0]
+                if member.isdir() and member.name.rstrip('/') == top_level:
+                    prefix = top_level + '/'
+                    continue
+                prefix = top_level + '/' if '/' in member.name else ''
+            if prefix and member.name.startswith(prefix):
+                member.name = member.name[len(prefix):]
+                # Hard links refer to other members by their archive path
+                if member.islnk() and member.linkname.startswith(prefix):
+                    member.linkname = member.linkname[len(prefix):]
+            yield member
+
     @staticmethod
     def _download_module_version(source_url: str, target_path: str) -> None:
         try:
-            response = requests.get(source_url, stream=True, headers=AzureVerifiedModuleDocumentationProvider._get_header())
-            response.raise_for_status()
+            response = AzureVerifiedModuleDocumentationProvider._session.get(source_url, stream=True, headers=AzureVerifiedModuleDocumentationProvider._get_header())
+            AzureVerifiedModuleDocumentationProvider._raise_for_status(response)
 
-            uuid_str = str(uuid.uuid4())
-            download_path = os.path.join(target_path, f"{uuid_str}.tar.gz")
             extract_to = target_path
             os.makedirs(extract_to, exist_ok=True)
             
-            with open(download_path, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
-        
-            # Extract the downloaded file
-            with tarfile.open(download_path, "r:gz") as tar:
+            # Extract straight from the response stream instead of saving the archive first
+            response.raw.decode_content = True
+            # The 'data' filter rejects absolute paths and links escaping the target (Python 3.11.4+)
+            extract_options = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
                 # On Windows, extracting archives may fail due to path length limitations. See the Troubleshooting of README.md for details.
-                tar.extractall(path=extract_to)
-            os.remove(download_path)
-            
-            # re-organize the directory structure
-            if len(os.listdir(extract_to)) == 1:
-                src = os.path.join(extract_to, os.listdir(extract_to)[0])
-                if os.path.isdir(src):
-                    for entry in os.listdir(src):
-                        shutil.move(os.path.join(src, entry), extract_to)
-                    shutil.rmtree(src)
+                tar.extractall(
+                    path=extract_to,
+                    members=AzureVerifiedModuleDocumentationProvider._strip_top_level_directory(tar),
+                    **extract_options,
+                )
         except Exception as e:
             if os.path.exists(target_path):
                 shutil.rmtree(target_path)
             raise_unexpected_exception(f"Failed to download module version from {source_url}: {e}")
     
+    @staticmethod
+    def _read_tf_files(base_path: str, prefix: str) -> str:
+        # DirEntry already carries the full path, so no per-file join is needed
+        with os.scandir(base_path) as entries:
+            tf_files = [entry.path for entry in entries if entry.name.endswith('.tf') and entry.name.startswith(prefix)]
+
+        contents = []
+        for tf_file in tf_files:
+            with open(tf_file, 'r') as file:
+                contents.append(file.read())
+        
+        # One join instead of growing a string per file
+        return ''.join(content + "\n" for content in contents)
+    
     def _retrieve_version_info(self, module_name: str):
         available_modules = self._module_collection()
         if module_name not in available_modules:
             raise_expected_exception(f"Module {module_name} not found in available modules.")
 
         versions = dict()
-        response = requests.get('/'.join([available_modules[module_name][Constants.MODULE_REPO_URL_FIELD].replace("github.com", "api.github.com/repos"),'releases']), headers=AzureVerifiedModuleDocumentationProvider._get_header())
-        response.raise_for_status()
+        response = self._session.get('/'.join([available_modules[module_name][Constants.MODULE_REPO_URL_FIELD].replace("github.com", "api.github.com/repos"),'releases']), headers=AzureVerifiedModuleDocumentationProvider._get_header())
+        AzureVerifiedModuleDocumentationProvider._raise_for_status(response)
         for version in response.json():
             tag_name = version[Constants.VERSION_TAG_NAME_FIELD].lstrip('v')
             versions[tag_name] = dict()
@@ -168,45 +240,95 @@ class AzureVerifiedModuleDocumentationProvider:
         available_versions.sort(key=lambda x: x[Constants.VERSION_CREATED_AT_FIELD], reverse=True)
         return [item[Constants.VERSION_TAG_NAME_FIELD] for item in available_versions]
     
+    @staticmethod
+    def _parse_module_rows(lines) -> dict[str, dict]:
+        # Resolve column positions once instead of building a dict per row
+        reader = csv.reader(lines)
+        header = next(reader)
+        name_index = header.index(Constants.MODULE_NAME_COLUMN)
+        description_index = header.index(Constants.DESCRIPTION_COLUMN)
+        status_index = header.index(Constants.MODULE_STATUS_COLUMN)
+        repo_url_index = header.index(Constants.MODULE_REPO_URL_COLUMN)
+
+        available_modules = dict()
+        for row in reader:
+            # Blank lines come through as empty rows (DictReader skipped them)
+            if not row or row[status_index] == Constants.MODULE_STATUS_PROPOSED:
+                continue
+
+            available_module = dict()
+            available_module[Constants.MODULE_NAME_FIELD] = row[name_index]
+            available_module[Constants.MODULE_DESCRIPTION_FIELD] = row[description_index]
+            available_module[Constants.MODULE_REPO_URL_FIELD] = row[repo_url_index]
+            available_module[Constants.MODULE_SOURCE_FIELD] = AzureVerifiedModuleDocumentationProvider._source_from_repo_url(row[repo_url_index])
+            
+            available_modules[row[name_index]] = available_module
+
+        return available_modules
+
+    @staticmethod
+    def _load_module_file(module_file_path: str) -> dict[str, dict]:
+        with open(module_file_path, 'r', encoding='utf-8', newline='') as f:
+            return AzureVerifiedModuleDocumentationProvider._parse_module_rows(f)
+
+    @staticmethod
+    def _stream_module_file(response: requests.Response, module_file_path: str) -> dict[str, dict]:
+        def tee(source, cache_file):
+            for line in source:
+                cache_file.write(line)
+                yield line
+
+        # Parse the CSV as it arrives and save it alongside; the cache file is only
+        # replaced once the whole index has been read and parsed successfully
+        temp_path = f"{module_file_path}.tmp"
+        response.raw.decode_content = True
+        try:
+            with io.TextIOWrapper(response.raw, encoding='utf-8', newline='') as source, \
+                    open(temp_path, 'w', encoding='utf-8', newline='') as cache_file:
+                available_modules = AzureVerifiedModuleDocumentationProvider._parse_module_rows(tee(source, cache_file))
+            os.replace(temp_path, module_file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return available_modules
+
     def _module_collection(self) -> dict[str, dict]:        
+        # The parsed modules expire with the CSV they came from, so hits skip disk I/O entirely
+        if self._available_modules is not None and (time.time() - self._cache_loaded_at) < Constants.CACHE_EXPIRATION_SECONDS:
+            return self._available_modules
+
         try:
             module_file_path = os.path.join(Constants.LOCAL_DATA_BASE_PATH, Constants.AVAILABLE_MODULE_FILE)
-            if os.path.exists(module_file_path) and (time.time() - os.path.getmtime(module_file_path)) < Constants.CACHE_EXPIRATION_SECONDS:
+            loaded_at = os.path.getmtime(module_file_path) if os.path.exists(module_file_path) else 0.0
+            if (time.time() - loaded_at) < Constants.CACHE_EXPIRATION_SECONDS:
                 logger.info("Loading available modules from local cache...")
-                if self._available_modules is not None:
-                    return self._available_modules
-                
-                with open(module_file_path, 'r', encoding='utf-8') as f:
-                    csv_content = f.read()
+                available_modules = AzureVerifiedModuleDocumentationProvider._load_module_file(module_file_path)
             else:
                 logger.info("Fetching available modules from remote URL...")
-                response = requests.get(Constants.AVAILABLE_MODULES_URL)
-                response.raise_for_status()
-                csv_content = response.text
-                # Save the fresh content to the cache file
-                with open(module_file_path, 'w', encoding='utf-8') as f:
-                    f.write(csv_content)
-            
-            dict_reader = csv.DictReader(io.StringIO(csv_content))
-            available_modules = dict()
-            for row in dict_reader:
-                if row[Constants.MODULE_STATUS_COLUMN] == Constants.MODULE_STATUS_PROPOSED:
-                    continue
-
-                available_module = dict()
-                available_module[Constants.MODULE_NAME_FIELD] = row[Constants.MODULE_NAME_COLUMN]
-                available_module[Constants.MODULE_DESCRIPTION_FIELD] = row[Constants.DESCRIPTION_COLUMN]
-                available_module[Constants.MODULE_REPO_URL_FIELD] = row[Constants.MODULE_REPO_URL_COLUMN]
-                available_module[Constants.MODULE_SOURCE_FIELD] = AzureVerifiedModuleDocumentationProvider._source_from_repo_url(row[Constants.MODULE_REPO_URL_COLUMN])
-                
-                available_modules[row[Constants.MODULE_NAME_COLUMN]] = available_module
+                # Revalidate an expired cache file instead of downloading the index again
+                headers = {}
+                if self._available_modules_etag and os.path.exists(module_file_path):
+                    headers["If-None-Match"] = self._available_modules_etag
+                response = self._session.get(Constants.AVAILABLE_MODULES_URL, headers=headers, stream=True)
+                loaded_at = time.time()
+                if response.status_code == 304:
+                    logger.info("Available modules unchanged, refreshing local cache...")
+                    response.close()
+                    os.utime(module_file_path)
+                    available_modules = AzureVerifiedModuleDocumentationProvider._load_module_file(module_file_path)
+                else:
+                    response.raise_for_status()
+                    available_modules = AzureVerifiedModuleDocumentationProvider._stream_module_file(response, module_file_path)
+                self._available_modules_etag = response.headers.get("ETag", self._available_modules_etag)
 
             self._available_modules = available_modules    
+            self._cache_loaded_at = loaded_at
             return self._available_modules
         except Exception as e:
             raise_unexpected_exception(f"Error retrieving available modules: {e}")
 
-    def available_modules(self) -> str:
+    def available_modules(self, pretty: bool = False) -> str:
         result = []
         for _, module in self._module_collection().items():
             result.append({
@@ -215,7 +337,7 @@ class AzureVerifiedModuleDocumentationProvider:
                 "source": module[Constants.MODULE_SOURCE_FIELD],
             })
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result, pretty)
     
     def latest_module_version(self, module_name: str) -> str:
         available_versions = self._module_version_list(module_name)
@@ -224,33 +346,19 @@ class AzureVerifiedModuleDocumentationProvider:
 
         return available_versions[0]
     
-    def module_versions(self, module_name: str) -> str:
+    def module_versions(self, module_name: str, pretty: bool = False) -> str:
         versions = self._module_version_list(module_name)
-        return json.dumps(versions, indent=2) if versions else f"No versions found for module: {module_name}"
+        return dumps_json(versions, pretty) if versions else f"No versions found for module: {module_name}"
     
     def module_variables(self, module_name: str, raw_version: str) -> str:
         version = raw_version.lstrip('v')
         base_path = self._retrieve_version_path(module_name, version)
-        variable_files = [f for f in os.listdir(base_path) if f.endswith('.tf') and f.startswith('variable')]
-
-        result = ""
-        for variable_file in variable_files:
-            with open(os.path.join(base_path, variable_file), 'r') as file:
-                result += file.read() + "\n"
-        
-        return result
+        return AzureVerifiedModuleDocumentationProvider._read_tf_files(base_path, 'variable')
 
     def module_outputs(self, module_name: str, raw_version: str) -> str:
         version = raw_version.lstrip('v')
-        base_path = self._retrieve_version_path(module_name, version)        
-        output_files = [f for f in os.listdir(base_path) if f.endswith('.tf') and f.startswith('output')]
-
-        result = ""
-        for output_file in output_files:
-            with open(os.path.join(base_path, output_file), 'r') as file:
-                result += file.read() + "\n"
-        
-        return result
+        base_path = self._retrieve_version_path(module_name, version)
+        return AzureVerifiedModuleDocumentationProvider._read_tf_files(base_path, 'output')
 
 
 # Global instance
@@ -2,18 +2,89 @@
 AzAPI provider documentation tools for Azure Terraform MCP Server.
 """
 
-from typing import Dict, Any
-from httpx import AsyncClient
+import asyncio
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from httpx import AsyncClient, Limits
 
 from ..core.config import load_azapi_schema
 
+# Number of distinct schema queries whose results are kept in memory
+_SCHEMA_CACHE_SIZE = 1024
+# How long a docs page that answered 200 is trusted before it is fetched again
+_DOCS_URL_TTL_SECONDS = 3600.0
+
+
+@lru_cache(maxsize=1024)
+def _azure_docs_url(resource_type: str) -> str:
+    """Azure REST API docs URL for a resource type."""
+    return f"https://docs.microsoft.com/en-us/rest/api/{resource_type.lower()}"
+
 
 class AzAPIDocumentationProvider:
     """Provider for AzAPI Terraform documentation."""
     
     def __init__(self):
         """Initialize the AzAPI documentation provider."""
-        self.azapi_schema = load_azapi_schema()
+        # The schema is loaded on first use so server startup does not pay for it
+        self._azapi_schema: Optional[Dict[str, Any]] = None
+        self._schema_lock = threading.Lock()
+        self._schema_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._docs_url_expiry: Dict[str, float] = {}
+        # Pooled client shared by every online lookup; created on first use so it
+        # binds to the running event loop
+        self._client: Optional[AsyncClient] = None
+    
+    @property
+    def azapi_schema(self) -> Dict[str, Any]:
+        """The AzAPI schema, loaded and indexed on first access."""
+        if self._azapi_schema is None:
+            with self._schema_lock:
+                if self._azapi_schema is None:
+                    schema = load_azapi_schema()
+                    self._build_schema_index(schema)
+                    self._azapi_schema = schema
+        return self._azapi_schema
+    
+    def _build_schema_index(self, schema: Dict[str, Any]) -> None:
+        """Precompute lowercased schema keys for _search_azapi_schema."""
+        keys = list(schema or {})
+        lower_keys = [key.lower() for key in keys]
+        # Exact (case-insensitive) lookups; the first key wins, as in a scan
+        self._schema_lower_keys: Dict[str, str] = {}
+        for key, lower_key in zip(keys, lower_keys):
+            self._schema_lower_keys.setdefault(lower_key, key)
+        # All lowercased keys joined by newlines, so a substring query is a single
+        # str.find; _schema_key_offsets maps a match position back to its key
+        self._schema_keys: List[str] = keys
+        self._schema_key_offsets: List[int] = []
+        offset = 0
+        for lower_key in lower_keys:
+            self._schema_key_offsets.append(offset)
+            offset += len(lower_key) + 1
+        self._schema_blob = "\n".join(lower_keys)
+    
+    def _get_client(self) -> AsyncClient:
+        """Return the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            # docs.microsoft.com answers most paths with a redirect to learn.microsoft.com
+            self._client = AsyncClient(
+                timeout=30.0,
+                follow_redirects=True,
+                limits=Limits(max_keepalive_connections=20, max_connections=50),
+                headers={"User-Agent": "tf-mcp-server"},
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def search_azapi_provider_docs(
         self, 
@@ -31,6 +102,10 @@ class AzAPIDocumentationProvider:
             Dictionary containing AzAPI documentation and schema information
         """
         try:
+            if self._azapi_schema is None:
+                # Load the schema in a worker thread to keep the event loop free
+                await asyncio.to_thread(lambda: self.azapi_schema)
+            
             # Search in loaded schema
             schema_info = self._search_azapi_schema(resource_type, api_version)
             
@@ -60,33 +135,62 @@ class AzAPIDocumentationProvider:
         # Normalize the resource type for searching
         search_type = resource_type.lower()
         
-        # Search through the schema
-        for key, value in self.azapi_schema.items():
-            if search_type in key.lower():
-                return {
-                    "definition": value,
-                    "schema_key": key
-                }
+        cached = self._schema_cache.get(search_type)
+        if cached is not None:
+            self._schema_cache.move_to_end(search_type)
+            return cached
+        
+        result = {}
+        key = self._schema_lower_keys.get(search_type)
+        if key is None:
+            key = self._find_schema_key(search_type)
+        if key is not None:
+            result = {
+                "definition": self.azapi_schema[key],
+                "schema_key": key
+            }
         
-        return {}
+        self._schema_cache[search_type] = result
+        if len(self._schema_cache) > _SCHEMA_CACHE_SIZE:
+            self._schema_cache.popitem(last=False)
+        return result
+    
+    def _find_schema_key(self, search_type: str) -> Optional[str]:
+        """Return the first schema key containing search_type, if any."""
+        if "\n" in search_type:
+            # A match could straddle two keys in the joined index
+            return next((key for key in self._schema_keys if search_type in key.lower()), None)
+        position = self._schema_blob.find(search_type)
+        if position < 0:
+            return None
+        return self._schema_keys[bisect_right(self._schema_key_offsets, position) - 1]
     
     async def _fetch_azapi_docs_online(self, resource_type: str, api_version: str) -> Dict[str, Any]:
         """Fetch AzAPI documentation from online sources."""
         try:
             # Try Azure REST API documentation
-            azure_docs_url = f"https://docs.microsoft.com/en-us/rest/api/{resource_type.lower()}"
+            azure_docs_url = _azure_docs_url(resource_type)
+            
+            # Pages known to exist are not fetched again until their entry expires
+            found = self._docs_url_expiry.get(azure_docs_url, 0.0) > time.monotonic()
+            if not found:
+                # Only the page's existence matters, so skip the body unless HEAD is refused
+                client = self._get_client()
+                response = await client.head(azure_docs_url)
+                if response.status_code == 405:
+                    response = await client.get(azure_docs_url)
+                found = response.status_code == 200
+                if found:
+                    self._docs_url_expiry[azure_docs_url] = time.monotonic() + _DOCS_URL_TTL_SECONDS
             
-            async with AsyncClient(timeout=30.0) as client:
-                response = await client.get(azure_docs_url)
-                
-                if response.status_code == 200:
-                    return {
-                        "resource_type": resource_type,
-                        "api_version": api_version or "latest",
-                        "documentation_url": azure_docs_url,
-                        "source": "Azure REST API docs",
-                        "summary": f"Azure REST API documentation for {resource_type}"
-                    }
+            if found:
+                return {
+                    "resource_type": resource_type,
+                    "api_version": api_version or "latest",
+                    "documentation_url": azure_docs_url,
+                    "source": "Azure REST API docs",
+                    "summary": f"Azure REST API documentation for {resource_type}"
+                }
         
         except Exception as e:
             pass  # Continue to fallback
@@ -103,11 +207,16 @@ class AzAPIDocumentationProvider:
 
 # Global instance
 _azapi_provider = None
+# Creation never awaits, so coroutines cannot race here; the lock covers callers
+# on worker threads
+_azapi_provider_lock = threading.Lock()
 
 
 def get_azapi_documentation_provider() -> AzAPIDocumentationProvider:
     """Get the global AzAPI documentation provider instance."""
     global _azapi_provider
     if _azapi_provider is None:
-        _azapi_provider = AzAPIDocumentationProvider()
+        with _azapi_provider_lock:
+            if _azapi_provider is None:
+                _azapi_provider = AzAPIDocumentationProvider()
     return _azapi_provider
@@ -3,20 +3,66 @@ Azure Export for Terraform (aztfexport) utilities for Azure Terraform MCP Server
 """
 
 import asyncio
+import codecs
 import json
 import logging
 import os
+import secrets
+import shlex
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from ..core.utils import get_workspace_root, resolve_workspace_path
 
 logger = logging.getLogger(__name__)
 
+# orjson raises a json.JSONDecodeError subclass, so callers catch either the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# First characters of any JSON value other than the bare literals below
+_JSON_START_CHARS = frozenset('{["-0123456789')
+_JSON_LITERALS = frozenset({'true', 'false', 'null'})
+
+# Pipe read size used while an export is running
+_READ_CHUNK = 64 * 1024
+
+# Resolved binary paths, shared by every runner and used to start the commands,
+# so PATH is searched once per process rather than on every spawn
+_AZTFEXPORT_BIN: Optional[str] = None
+_TERRAFORM_BIN: Optional[str] = None
+
+# Last successful check_installation result and when it was taken
+_INSTALLATION_INFO: Optional[Dict[str, Any]] = None
+_INSTALLATION_CHECKED_AT = 0.0
+_INSTALLATION_TTL_SECONDS = 60.0
+
+# Files returned from an export: anything with these suffixes, plus the
+# well-known names aztfexport generates
+_GENERATED_FILE_SUFFIXES = ('.tf', '.tfvars', '.json')
+_GENERATED_FILE_NAMES = frozenset({
+    'main.tf',
+    'terraform.tf',
+    'provider.tf',
+    'variables.tf',
+    'outputs.tf',
+    'import.tf',
+})
+# The state file can be several MB and is only returned on request
+_STATE_FILE_NAME = 'terraform.tfstate'
+# Generated files larger than this are returned truncated
+_MAX_GENERATED_FILE_BYTES = 512 * 1024
+
 
 class AztfexportProvider(Enum):
     """Supported Terraform providers for aztfexport."""
@@ -34,48 +80,74 @@ class AztfexportCommand(Enum):
 class AztfexportRunner:
     """Azure Export for Terraform command execution utilities."""
     
-    def __init__(self):
-        """Initialize the aztfexport runner."""
+    def __init__(self, max_concurrent_commands: Optional[int] = None):
+        """
+        Initialize the aztfexport runner.
+        
+        Args:
+            max_concurrent_commands: Maximum number of aztfexport/terraform processes
+                run at once; defaults to half the CPU count, at least 2
+        """
         self._check_dependencies()
+        if max_concurrent_commands is None:
+            # Each export already runs with its own --parallelism, so keep the
+            # number of simultaneous processes well below the core count
+            max_concurrent_commands = max(2, (os.cpu_count() or 1) // 2)
+        self.max_concurrent_commands = max_concurrent_commands
+        self._command_semaphore = asyncio.Semaphore(max_concurrent_commands)
     
     def _check_dependencies(self) -> None:
         """Check if required dependencies are installed."""
+        global _AZTFEXPORT_BIN, _TERRAFORM_BIN
+        
         # Check if aztfexport is available
-        if not shutil.which("aztfexport"):
-            raise RuntimeError("aztfexport is not installed or not available in PATH. "
-                             "Please install it from: https://github.com/Azure/aztfexport/releases")
+        if _AZTFEXPORT_BIN is None:
+            _AZTFEXPORT_BIN = shutil.which("aztfexport")
+            if not _AZTFEXPORT_BIN:
+                raise RuntimeError("aztfexport is not installed or not available in PATH. "
+                                 "Please install it from: https://github.com/Azure/aztfexport/releases")
         
         # Check if terraform is available
-        if not shutil.which("terraform"):
-            raise RuntimeError("terraform is not installed or not available in PATH. "
-                             "aztfexport requires terraform >= v0.12")
+        if _TERRAFORM_BIN is None:
+            _TERRAFORM_BIN = shutil.which("terraform")
+            if not _TERRAFORM_BIN:
+                raise RuntimeError("terraform is not installed or not available in PATH. "
+                                 "aztfexport requires terraform >= v0.12")
     
     async def _run_command(self, command: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
         """
         Run a command asynchronously and return the result.
         
+        At most ``max_concurrent_commands`` commands run at once; further calls
+        wait for a slot.
+        
         Args:
             command: Command and arguments to execute
             cwd: Working directory for the command
             
         Returns:
-            Dictionary with exit_code, stdout, stderr
+            Dictionary with exit_code, stdout, stderr and the command as a tuple
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd
-            )
-            
-            stdout, stderr = await process.communicate()
+            async with self._command_semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd
+                )
+                
+                stdout, stderr, _ = await asyncio.gather(
+                    self._read_stream(process.stdout),
+                    self._read_stream(process.stderr),
+                    process.wait()
+                )
             
             return {
                 'exit_code': process.returncode,
-                'stdout': stdout.decode('utf-8', errors='ignore'),
-                'stderr': stderr.decode('utf-8', errors='ignore'),
-                'command': ' '.join(command)
+                'stdout': stdout,
+                'stderr': stderr,
+                'command': tuple(command)
             }
             
         except Exception as e:
@@ -83,9 +155,31 @@ class AztfexportRunner:
                 'exit_code': -1,
                 'stdout': '',
                 'stderr': f'Failed to execute command: {str(e)}',
-                'command': ' '.join(command)
+                'command': tuple(command)
             }
     
+    @staticmethod
+    async def _read_stream(stream: asyncio.StreamReader) -> str:
+        """
+        Read a subprocess pipe to EOF, decoding it as it arrives.
+        
+        Args:
+            stream: Subprocess stdout or stderr reader
+            
+        Returns:
+            Decoded output
+        """
+        # The incremental decoder carries multi-byte characters split across chunks
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        parts = []
+        while True:
+            chunk = await stream.read(_READ_CHUNK)
+            if not chunk:
+                break
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+    
     async def check_installation(self) -> Dict[str, Any]:
         """
         Check aztfexport installation and get version information.
@@ -93,23 +187,31 @@ class AztfexportRunner:
         Returns:
             Installation status and version information
         """
+        global _INSTALLATION_INFO, _INSTALLATION_CHECKED_AT
+        
+        # Repeated checks within the TTL reuse the last successful probe
+        if _INSTALLATION_INFO is not None and time.monotonic() - _INSTALLATION_CHECKED_AT < _INSTALLATION_TTL_SECONDS:
+            return dict(_INSTALLATION_INFO)
+        
         try:
             # Check aztfexport version
-            result = await self._run_command(['aztfexport', '--version'])
+            result = await self._run_command([_AZTFEXPORT_BIN, '--version'])
             
             if result['exit_code'] == 0:
                 version = result['stdout'].strip()
                 
                 # Check terraform version
-                tf_result = await self._run_command(['terraform', '--version'])
+                tf_result = await self._run_command([_TERRAFORM_BIN, '--version'])
                 tf_version = tf_result['stdout'].strip() if tf_result['exit_code'] == 0 else "Unknown"
                 
-                return {
+                _INSTALLATION_INFO = {
                     'installed': True,
                     'aztfexport_version': version,
                     'terraform_version': tf_version,
                     'status': 'Ready to use'
                 }
+                _INSTALLATION_CHECKED_AT = time.monotonic()
+                return dict(_INSTALLATION_INFO)
             else:
                 return {
                     'installed': False,
@@ -146,13 +248,8 @@ class AztfexportRunner:
         Returns:
             Unique folder name with timestamp and random component
         """
-        import time
-        import random
-        import string
-        
-        timestamp = int(time.time())
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        return f"{prefix}_{timestamp}_{random_suffix}"
+        # token_hex(3) gives six lowercase hex characters in a single call
+        return f"{prefix}_{int(time.time())}_{secrets.token_hex(3)}"
     
     def _get_output_directory(self, output_folder_name: Optional[str] = None) -> Path:
         """
@@ -164,15 +261,13 @@ class AztfexportRunner:
         Returns:
             Path object for the output directory
         """
-        workspace_root = get_workspace_root()
-
         if output_folder_name:
             # Use provided folder name relative to the workspace root
             work_dir = resolve_workspace_path(output_folder_name)
         else:
-            # Generate unique folder name within the workspace root
+            # Generate unique folder name within the workspace root (cached per process)
             folder_name = self._generate_output_folder_name()
-            work_dir = workspace_root / folder_name
+            work_dir = get_workspace_root() / folder_name
         
         # Create directory if it doesn't exist
         work_dir.mkdir(parents=True, exist_ok=True)
@@ -188,7 +283,8 @@ class AztfexportRunner:
         dry_run: bool = False,
         include_role_assignment: bool = False,
         parallelism: int = 10,
-        continue_on_error: bool = False
+        continue_on_error: bool = False,
+        include_state: bool = False
     ) -> Dict[str, Any]:
         """
         Export a single Azure resource to Terraform configuration.
@@ -203,71 +299,23 @@ class AztfexportRunner:
             include_role_assignment: Include role assignments in export
             parallelism: Number of parallel operations
             continue_on_error: Continue export even if some resources fail
+            include_state: Also return terraform.tfstate among the generated files
             
         Returns:
             Export result with generated files and status
         """
-        try:
-            # Get output directory
-            work_dir = self._get_output_directory(output_folder_name)
-            
-            # Build command
-            command = ['aztfexport', 'resource']
-            
-            # Add non-interactive flags for containerized environments
-            command.extend(['--non-interactive', '--plain-ui'])
-            
-            # Add provider flag
-            if provider == AztfexportProvider.AZAPI:
-                command.extend(['--provider-name', 'azapi'])
-            
-            # Add options
-            if resource_name:
-                command.extend(['--name', resource_name])
-            
-            if resource_type:
-                command.extend(['--type', resource_type])
-            
-            if dry_run:
-                command.append('--dry-run')
-            
-            if include_role_assignment:
-                command.append('--include-role-assignment')
-            
-            command.extend(['--parallelism', str(parallelism)])
-            
-            if continue_on_error:
-                command.append('--continue')
-            
-            # Add resource ID
-            command.append(resource_id)
-            
-            # Execute command
-            result = await self._run_command(command, str(work_dir))
-            
-            # Process results
-            export_result = {
-                'exit_code': result['exit_code'],
-                'command': result['command'],
-                'stdout': result['stdout'],
-                'stderr': result['stderr'],
-                'success': result['exit_code'] == 0,
-                'output_directory': str(work_dir),
-                'generated_files': {}
-            }
-            
-            # If successful, read generated files
-            if result['exit_code'] == 0:
-                export_result['generated_files'] = await self._read_generated_files(work_dir)
-            
-            return export_result
-            
-        except Exception as e:
-            return {
-                'exit_code': -1,
-                'success': False,
-                'error': str(e)
-            }
+        return await self._run_export(
+            AztfexportCommand.RESOURCE,
+            resource_id,
+            output_folder_name=output_folder_name,
+            provider=provider,
+            options=(('--name', resource_name), ('--type', resource_type)),
+            dry_run=dry_run,
+            include_role_assignment=include_role_assignment,
+            parallelism=parallelism,
+            continue_on_error=continue_on_error,
+            include_state=include_state
+        )
     
     async def export_resource_group(
         self,
@@ -279,7 +327,8 @@ class AztfexportRunner:
         dry_run: bool = False,
         include_role_assignment: bool = False,
         parallelism: int = 10,
-        continue_on_error: bool = False
+        continue_on_error: bool = False,
+        include_state: bool = False
     ) -> Dict[str, Any]:
         """
         Export Azure resource group and its resources to Terraform configuration.
@@ -294,71 +343,23 @@ class AztfexportRunner:
             include_role_assignment: Include role assignments in export
             parallelism: Number of parallel operations
             continue_on_error: Continue export even if some resources fail
+            include_state: Also return terraform.tfstate among the generated files
             
         Returns:
             Export result with generated files and status
         """
-        try:
-            # Get output directory
-            work_dir = self._get_output_directory(output_folder_name)
-            
-            # Build command
-            command = ['aztfexport', 'resource-group']
-            
-            # Add non-interactive flags for containerized environments
-            command.extend(['--non-interactive', '--plain-ui'])
-            
-            # Add provider flag
-            if provider == AztfexportProvider.AZAPI:
-                command.extend(['--provider-name', 'azapi'])
-            
-            # Add options
-            if name_pattern:
-                command.extend(['--name-pattern', name_pattern])
-            
-            if type_pattern:
-                command.extend(['--type-pattern', type_pattern])
-            
-            if dry_run:
-                command.append('--dry-run')
-            
-            if include_role_assignment:
-                command.append('--include-role-assignment')
-            
-            command.extend(['--parallelism', str(parallelism)])
-            
-            if continue_on_error:
-                command.append('--continue')
-            
-            # Add resource group name
-            command.append(resource_group_name)
-            
-            # Execute command
-            result = await self._run_command(command, str(work_dir))
-            
-            # Process results
-            export_result = {
-                'exit_code': result['exit_code'],
-                'command': result['command'],
-                'stdout': result['stdout'],
-                'stderr': result['stderr'],
-                'success': result['exit_code'] == 0,
-                'output_directory': str(work_dir),
-                'generated_files': {}
-            }
-            
-            # If successful, read generated files
-            if result['exit_code'] == 0:
-                export_result['generated_files'] = await self._read_generated_files(work_dir)
-            
-            return export_result
-            
-        except Exception as e:
-            return {
-                'exit_code': -1,
-                'success': False,
-                'error': str(e)
-            }
+        return await self._run_export(
+            AztfexportCommand.RESOURCE_GROUP,
+            resource_group_name,
+            output_folder_name=output_folder_name,
+            provider=provider,
+            options=(('--name-pattern', name_pattern), ('--type-pattern', type_pattern)),
+            dry_run=dry_run,
+            include_role_assignment=include_role_assignment,
+            parallelism=parallelism,
+            continue_on_error=continue_on_error,
+            include_state=include_state
+        )
     
     async def export_query(
         self,
@@ -370,7 +371,8 @@ class AztfexportRunner:
         dry_run: bool = False,
         include_role_assignment: bool = False,
         parallelism: int = 10,
-        continue_on_error: bool = False
+        continue_on_error: bool = False,
+        include_state: bool = False
     ) -> Dict[str, Any]:
         """
         Export Azure resources using Azure Resource Graph query to Terraform configuration.
@@ -385,6 +387,52 @@ class AztfexportRunner:
             include_role_assignment: Include role assignments in export
             parallelism: Number of parallel operations
             continue_on_error: Continue export even if some resources fail
+            include_state: Also return terraform.tfstate among the generated files
+            
+        Returns:
+            Export result with generated files and status
+        """
+        return await self._run_export(
+            AztfexportCommand.QUERY,
+            query,
+            output_folder_name=output_folder_name,
+            provider=provider,
+            options=(('--name-pattern', name_pattern), ('--type-pattern', type_pattern)),
+            dry_run=dry_run,
+            include_role_assignment=include_role_assignment,
+            parallelism=parallelism,
+            continue_on_error=continue_on_error,
+            include_state=include_state
+        )
+    
+    async def _run_export(
+        self,
+        command_type: AztfexportCommand,
+        target: str,
+        *,
+        output_folder_name: Optional[str],
+        provider: AztfexportProvider,
+        options: Tuple[Tuple[str, Optional[str]], ...],
+        dry_run: bool,
+        include_role_assignment: bool,
+        parallelism: int,
+        continue_on_error: bool,
+        include_state: bool
+    ) -> Dict[str, Any]:
+        """
+        Build and run an aztfexport export command, then collect its output.
+        
+        Args:
+            command_type: aztfexport subcommand to run
+            target: Resource ID, resource group name or query passed last
+            output_folder_name: Folder name for generated files (created under /workspace)
+            provider: Terraform provider to use (azurerm or azapi)
+            options: (flag, value) pairs; a flag is only passed when its value is set
+            dry_run: Perform a dry run without creating files
+            include_role_assignment: Include role assignments in export
+            parallelism: Number of parallel operations
+            continue_on_error: Continue export even if some resources fail
+            include_state: Also return terraform.tfstate among the generated files
             
         Returns:
             Export result with generated files and status
@@ -393,22 +441,15 @@ class AztfexportRunner:
             # Get output directory
             work_dir = self._get_output_directory(output_folder_name)
             
-            # Build command
-            command = ['aztfexport', 'query']
-            
-            # Add non-interactive flags for containerized environments
-            command.extend(['--non-interactive', '--plain-ui'])
+            # Non-interactive flags are required in containerized environments
+            command = [_AZTFEXPORT_BIN, command_type.value, '--non-interactive', '--plain-ui']
             
-            # Add provider flag
             if provider == AztfexportProvider.AZAPI:
-                command.extend(['--provider-name', 'azapi'])
+                command += ('--provider-name', 'azapi')
             
-            # Add options
-            if name_pattern:
-                command.extend(['--name-pattern', name_pattern])
-            
-            if type_pattern:
-                command.extend(['--type-pattern', type_pattern])
+            for flag, value in options:
+                if value:
+                    command += (flag, value)
             
             if dry_run:
                 command.append('--dry-run')
@@ -416,13 +457,12 @@ class AztfexportRunner:
             if include_role_assignment:
                 command.append('--include-role-assignment')
             
-            command.extend(['--parallelism', str(parallelism)])
+            command += ('--parallelism', str(parallelism))
             
             if continue_on_error:
                 command.append('--continue')
             
-            # Add query
-            command.append(query)
+            command.append(target)
             
             # Execute command
             result = await self._run_command(command, str(work_dir))
@@ -430,7 +470,8 @@ class AztfexportRunner:
             # Process results
             export_result = {
                 'exit_code': result['exit_code'],
-                'command': result['command'],
+                # Only export results report the command, so only they pay for quoting it
+                'command': shlex.join(result['command']),
                 'stdout': result['stdout'],
                 'stderr': result['stderr'],
                 'success': result['exit_code'] == 0,
@@ -440,7 +481,7 @@ class AztfexportRunner:
             
             # If successful, read generated files
             if result['exit_code'] == 0:
-                export_result['generated_files'] = await self._read_generated_files(work_dir)
+                export_result['generated_files'] = await self._read_generated_files(work_dir, include_state)
             
             return export_result
             
@@ -451,46 +492,81 @@ class AztfexportRunner:
                 'error': str(e)
             }
     
-    async def _read_generated_files(self, directory: Path) -> Dict[str, str]:
+    async def _read_generated_files(self, directory: Path, include_state: bool = False) -> Dict[str, str]:
         """
         Read generated Terraform files from the output directory.
         
         Args:
             directory: Output directory path
+            include_state: Also return terraform.tfstate
             
         Returns:
             Dictionary mapping filename to content
         """
-        files = {}
         try:
-            # Common Terraform files generated by aztfexport
-            terraform_files = [
-                'main.tf',
-                'terraform.tf',
-                'provider.tf',
-                'variables.tf',
-                'outputs.tf',
-                'terraform.tfstate',
-                'import.tf'
-            ]
-            
-            for file_path in directory.iterdir():
-                if file_path.is_file():
-                    try:
-                        # Read text files
-                        if file_path.suffix in ['.tf', '.tfvars', '.json'] or file_path.name in terraform_files:
-                            content = file_path.read_text(encoding='utf-8', errors='ignore')
-                            files[file_path.name] = content
-                    except Exception as e:
-                        logger.warning(f"Failed to read file {file_path}: {e}")
-                        files[file_path.name] = f"Error reading file: {e}"
-            
-            return files
+            # scandir entries carry the file type from the directory listing, so
+            # filtering needs no extra stat per file
+            with os.scandir(directory) as entries:
+                candidates = [
+                    entry for entry in entries
+                    if (entry.name.endswith(_GENERATED_FILE_SUFFIXES) or entry.name in _GENERATED_FILE_NAMES
+                        or (include_state and entry.name == _STATE_FILE_NAME))
+                    and entry.is_file()
+                ]
+            # Read in inode order, which tracks on-disk placement on most
+            # filesystems and helps readahead on rotational and network volumes.
+            # The reads run back to back in one worker thread so that order holds
+            # and the event loop stays free.
+            candidates.sort(key=os.DirEntry.inode)
+            return await asyncio.to_thread(
+                self._read_generated_file_batch, [entry.path for entry in candidates]
+            )
             
         except Exception as e:
             logger.error(f"Failed to read generated files: {e}")
             return {}
     
+    @classmethod
+    def _read_generated_file_batch(cls, paths: List[str]) -> Dict[str, str]:
+        """
+        Read generated files one after another, in the given order.
+        
+        Args:
+            paths: File paths
+            
+        Returns:
+            Dictionary mapping filename to content
+        """
+        files = {}
+        for path in paths:
+            try:
+                content = cls._read_generated_file(path)
+            except Exception as e:
+                logger.warning(f"Failed to read file {path}: {e}")
+                content = f"Error reading file: {e}"
+            files[os.path.basename(path)] = content
+        return files
+    
+    @staticmethod
+    def _read_generated_file(path: str) -> str:
+        """
+        Read one generated file, truncating it if it is very large.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            File content decoded as UTF-8
+        """
+        with open(path, 'rb') as f:
+            data = f.read(_MAX_GENERATED_FILE_BYTES + 1)
+            if len(data) <= _MAX_GENERATED_FILE_BYTES:
+                return data.decode('utf-8', errors='ignore')
+            # Only oversized files pay for the stat needed to report what was dropped
+            remaining = os.fstat(f.fileno()).st_size - _MAX_GENERATED_FILE_BYTES
+        content = data[:_MAX_GENERATED_FILE_BYTES].decode('utf-8', errors='ignore')
+        return content + f"\n...[truncated {remaining} bytes]"
+    
     async def get_config(self, key: Optional[str] = None) -> Dict[str, Any]:
         """
         Get aztfexport configuration.
@@ -503,24 +579,28 @@ class AztfexportRunner:
         """
         try:
             if key:
-                result = await self._run_command(['aztfexport', 'config', 'get', key])
+                result = await self._run_command([_AZTFEXPORT_BIN, 'config', 'get', key])
             else:
-                result = await self._run_command(['aztfexport', 'config', 'show'])
+                result = await self._run_command([_AZTFEXPORT_BIN, 'config', 'show'])
             
             if result['exit_code'] == 0:
-                try:
-                    # Try to parse as JSON if it looks like JSON
-                    config_data = json.loads(result['stdout'])
-                    return {
-                        'success': True,
-                        'config': config_data
-                    }
-                except json.JSONDecodeError:
-                    # Return as plain text if not JSON
-                    return {
-                        'success': True,
-                        'config': result['stdout'].strip()
-                    }
+                # Only attempt a parse when the output can start a JSON value, so the
+                # usual plain-text output skips the failed parse and its exception
+                stripped = result['stdout'].strip()
+                if stripped[:1] in _JSON_START_CHARS or stripped in _JSON_LITERALS:
+                    try:
+                        # Try to parse as JSON if it looks like JSON
+                        return {
+                            'success': True,
+                            'config': _json_loads(result['stdout'])
+                        }
+                    except json.JSONDecodeError:
+                        pass
+                # Return as plain text if not JSON
+                return {
+                    'success': True,
+                    'config': stripped
+                }
             else:
                 return {
                     'success': False,
@@ -546,7 +626,7 @@ class AztfexportRunner:
             Operation result
         """
         try:
-            result = await self._run_command(['aztfexport', 'config', 'set', key, value])
+            result = await self._run_command([_AZTFEXPORT_BIN, 'config', 'set', key, value])
             
             return {
                 'success': result['exit_code'] == 0,
@@ -564,11 +644,16 @@ class AztfexportRunner:
 
 # Global instance
 _aztfexport_runner = None
+# Creation never awaits, so coroutines cannot race here; the lock covers callers
+# on worker threads
+_aztfexport_runner_lock = threading.Lock()
 
 
 def get_aztfexport_runner() -> AztfexportRunner:
     """Get the global aztfexport runner instance."""
     global _aztfexport_runner
     if _aztfexport_runner is None:
-        _aztfexport_runner = AztfexportRunner()
+        with _aztfexport_runner_lock:
+            if _aztfexport_runner is None:
+                _aztfexport_runner = AztfexportRunner()
     return _aztfexport_runner
\ No newline at end of file
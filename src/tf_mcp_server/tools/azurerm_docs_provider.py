@@ -2,13 +2,38 @@
 AzureRM provider documentation tools for Azure Terraform MCP Server.
 """
 
+import asyncio
 import re
-from typing import Dict, Any, List, Optional, Union
-from httpx import AsyncClient
+import time
+from typing import Dict, Any, List, Optional, Tuple, Union
+from httpx import AsyncClient, Limits
 from pydantic import BaseModel, Field
 
 from ..core.models import ArgumentDetail, TerraformAzureProviderDocsResult
 
+# doc_type spellings that select data source documentation
+_DATA_SOURCE_DOC_TYPES = ("data-source", "datasource", "data_source")
+# How long a parsed documentation page is served from memory before it is fetched again
+_RESULT_TTL_SECONDS = 3600.0
+
+# Patterns used while parsing the documentation markdown, compiled once
+_ARGS_HEADER_RE = re.compile(r'^##\s+(Arguments?\s+Reference|Argument\s+Reference)', re.IGNORECASE)
+_ATTRS_HEADER_RE = re.compile(r'^##\s+(Attributes?\s+Reference|Attribute\s+Reference)', re.IGNORECASE)
+_BLOCK_HEADER_RE = re.compile(r'^(?:A|An|The)\s+`([^`]+)`\s+block\s+supports\s+the\s+following:', re.IGNORECASE)
+_ARG_LINE_RE = re.compile(r'^[\*\-]\s*`([^`]+)`\s*[-–—]\s*(.+)')
+_REQ_OPT_RE = re.compile(r'\s*\((?:Required|Optional)\)\s*[-–—]?\s*', re.IGNORECASE)
+_LEAD_DASH_RE = re.compile(r'^[-–—]\s*')
+# "NOTE:", "**Note:**", "> NOTE", "-> **NOTE:**", "~> Note:" and the like
+_NOTE_RE = re.compile(r'^(?:[-~]?>\s*)?(?:\*\*NOTE:?\*\*|NOTE:?)\s*(.*)$', re.IGNORECASE)
+_MD_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_MD_CODE_RE = re.compile(r'`(.*?)`')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+# First characters a line needs for the patterns above to have a chance of matching
+_BLOCK_HEADER_START = frozenset('AaTt')
+_BULLET_START = frozenset('*-')
+_NOTE_START = frozenset('>-~*Nn')
+
 class AzureRMDocumentationProvider:
     """Provider for AzureRM Terraform documentation."""
     
@@ -16,6 +41,28 @@ class AzureRMDocumentationProvider:
         """Initialize the AzureRM documentation provider."""
         self.base_resources_url = "https://raw.githubusercontent.com/hashicorp/terraform-provider-azurerm/main/website/docs/r"
         self.base_datasources_url = "https://raw.githubusercontent.com/hashicorp/terraform-provider-azurerm/main/website/docs/d"
+        # Pooled client shared by every lookup; created on first use so it binds
+        # to the running event loop
+        self._client: Optional[AsyncClient] = None
+        # Parsed pages by (resource_type, is data source), with the time they were cached,
+        # and the fetches currently running for each key
+        self._result_cache: Dict[Tuple[str, bool], Tuple[float, TerraformAzureProviderDocsResult]] = {}
+        self._pending: Dict[Tuple[str, bool], "asyncio.Task[TerraformAzureProviderDocsResult]"] = {}
+    
+    def _get_client(self) -> AsyncClient:
+        """Return the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = AsyncClient(
+                timeout=30.0,
+                limits=Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def search_azurerm_provider_docs(
         self, 
@@ -31,6 +78,37 @@ class AzureRMDocumentationProvider:
             search_query: Optional specific query within the documentation
             doc_type: Type of documentation to search ("resource" or "data-source")
             
+        Returns:
+            Comprehensive documentation result
+        """
+        key = (resource_type, doc_type.lower() in _DATA_SOURCE_DOC_TYPES)
+        cached = self._result_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _RESULT_TTL_SECONDS:
+            return cached[1]
+        
+        # Concurrent requests for the same page share one fetch. The fetch runs as its
+        # own task, so a caller that is cancelled does not cancel it for the others.
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_provider_docs(resource_type, doc_type, key))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch_provider_docs(
+        self,
+        resource_type: str,
+        doc_type: str,
+        key: Tuple[str, bool]
+    ) -> TerraformAzureProviderDocsResult:
+        """
+        Download and parse one documentation page, caching it when found.
+        
+        Args:
+            resource_type: Azure resource type to search for
+            doc_type: Type of documentation to search ("resource" or "data-source")
+            key: Result cache key for this request
+            
         Returns:
             Comprehensive documentation result
         """
@@ -39,24 +117,25 @@ class AzureRMDocumentationProvider:
             # Remove azurerm_ prefix if present
             normalized_type = resource_type.lower().replace('azurerm_', '')
             
-            # Generate documentation URL based on type
-            if doc_type.lower() in ["data-source", "datasource", "data_source"]:
+            # Generate documentation URL based on type, and the other type as a fallback
+            if key[1]:
                 doc_url = f"{self.base_datasources_url}/{normalized_type}.html.markdown"
+                fallback_url = f"{self.base_resources_url}/{normalized_type}.html.markdown"
             else:
                 doc_url = f"{self.base_resources_url}/{normalized_type}.html.markdown"
+                fallback_url = f"{self.base_datasources_url}/{normalized_type}.html.markdown"
             
-            # Fetch documentation
-            async with AsyncClient(timeout=30.0) as client:
-                response = await client.get(doc_url)
+            # Fetch documentation; the fallback request is started alongside the
+            # primary one so a wrong doc_type guess costs one round trip, not two
+            client = self._get_client()
+            primary_task = asyncio.ensure_future(client.get(doc_url))
+            fallback_task = asyncio.ensure_future(client.get(fallback_url))
+            try:
+                response = await primary_task
                 
                 if response.status_code != 200:
                     # If resource not found, try the other type
-                    if doc_type.lower() in ["data-source", "datasource", "data_source"]:
-                        fallback_url = f"{self.base_resources_url}/{normalized_type}.html.markdown"
-                    else:
-                        fallback_url = f"{self.base_datasources_url}/{normalized_type}.html.markdown"
-                    
-                    fallback_response = await client.get(fallback_url)
+                    fallback_response = await fallback_task
                     if fallback_response.status_code == 200:
                         response = fallback_response
                         doc_url = fallback_url
@@ -69,30 +148,36 @@ class AzureRMDocumentationProvider:
                             attributes=[],
                             examples=[]
                         )
-                
-                # Parse the markdown content
-                markdown_content = response.text
-                
-                # Determine if this is a data source or resource based on URL
-                is_data_source = "docs/d/" in doc_url
-                
-                # Extract information from the documentation page
-                summary = self._extract_summary(markdown_content, resource_type, is_data_source)
-                arguments = self._extract_arguments(markdown_content, is_data_source)
-                attributes = self._extract_attributes(markdown_content)
-                examples = self._extract_examples(markdown_content, normalized_type, is_data_source)
-                notes = self._extract_notes(markdown_content)
-                
-                return TerraformAzureProviderDocsResult(
-                    resource_type=resource_type,
-                    documentation_url=doc_url,
-                    summary=summary,
-                    arguments=arguments,
-                    attributes=attributes,
-                    examples=examples,
-                    notes=notes
-                )
-                
+            finally:
+                if not fallback_task.done():
+                    fallback_task.cancel()
+                # Retrieve the outcome so an unused fallback never logs an unhandled error
+                await asyncio.gather(fallback_task, return_exceptions=True)
+            
+            # Parse the markdown content
+            markdown_content = response.text
+            
+            # Determine if this is a data source or resource based on URL
+            is_data_source = "docs/d/" in doc_url
+            
+            # Extract information from the documentation page
+            summary, arguments, attributes, examples, notes = self._parse_markdown(
+                markdown_content, resource_type, normalized_type, is_data_source
+            )
+            
+            result = TerraformAzureProviderDocsResult(
+                resource_type=resource_type,
+                documentation_url=doc_url,
+                summary=summary,
+                arguments=arguments,
+                attributes=attributes,
+                examples=examples,
+                notes=notes
+            )
+            # Only found pages are cached; misses and errors are retried next time
+            self._result_cache[key] = (time.monotonic(), result)
+            return result
+            
         except Exception as e:
             return TerraformAzureProviderDocsResult(
                 resource_type=resource_type,
@@ -104,307 +189,304 @@ class AzureRMDocumentationProvider:
                 notes=[]
             )
     
-    def _extract_summary(self, markdown_content: str, resource_type: str, is_data_source: bool = False) -> str:
-        """Extract summary from the markdown documentation."""
-        lines = markdown_content.split('\n')
+    def _parse_markdown(
+        self,
+        markdown_content: str,
+        resource_type: str,
+        normalized_type: str,
+        is_data_source: bool = False
+    ) -> Tuple[str, List[ArgumentDetail], List[Dict[str, str]], List[str], List[str]]:
+        """
+        Extract the summary, arguments, attributes, examples and notes from the markdown documentation.
         
-        # Look for the description after the front matter
-        in_frontmatter = False
-        frontmatter_ended = False
+        The lines are walked once. Block definitions, code blocks and notes can appear
+        anywhere in a page, so each section keeps its own state rather than sharing one.
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            # Track frontmatter boundaries
-            if line == '---':
-                if not in_frontmatter:
-                    in_frontmatter = True
-                    continue
-                else:
-                    frontmatter_ended = True
-                    continue
-            
-            # Skip frontmatter content
-            if in_frontmatter and not frontmatter_ended:
-                continue
-                
-            # Look for description after frontmatter
-            if frontmatter_ended and line and not line.startswith('#'):
-                # This is likely the description paragraph
-                if len(line) > 20:  # Reasonable length for a description
-                    return line
+        Args:
+            markdown_content: Raw markdown of the documentation page
+            resource_type: Resource type used for the default summary
+            normalized_type: Resource type without the azurerm_ prefix, used to match examples
+            is_data_source: Whether the page documents a data source
             
-            # Also look for description under ## Description header
-            if line.lower().startswith('## description'):
-                # Get the next non-empty line
-                for j in range(i + 1, min(i + 5, len(lines))):
-                    desc_line = lines[j].strip()
-                    if desc_line and not desc_line.startswith('#'):
-                        return desc_line
+        Returns:
+            Tuple of (summary, arguments, attributes, examples, notes)
+        """
+        lines = markdown_content.splitlines()
+        line_count = len(lines)
         
-        # Fallback to generating appropriate summary
-        return self._generate_default_summary(resource_type, is_data_source)
-    
-    def _generate_default_summary(self, resource_type: str, is_data_source: bool) -> str:
-        """Generate a default summary based on resource type and whether it's a data source."""
-        resource_display_name = resource_type.replace('_', ' ').title()
+        # Summary: the first long paragraph after the front matter, or the text under ## Description
+        summary = None
+        in_frontmatter = False
+        frontmatter_ended = False
         
-        if is_data_source:
-            return f"Use this data source to access information about an existing {resource_display_name}."
-        else:
-            return f"Manages an Azure {resource_display_name} resource."
-    
-    def _extract_arguments(self, markdown_content: str, is_data_source: bool = False) -> List[ArgumentDetail]:
-        """Extract argument information from the markdown documentation."""
+        # Arguments: the Arguments Reference section, up to the first block definition
         arguments = []
-        lines = markdown_content.split('\n')
-        
-        # First pass: Find all main arguments in the Arguments Reference section
         in_arguments_section = False
+        arguments_done = False
         
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            
-            # Look for Arguments Reference section
-            if re.match(r'^##\s+(Arguments?\s+Reference|Argument\s+Reference)', line_stripped, re.IGNORECASE):
-                in_arguments_section = True
-                continue
-            
-            # Stop when we hit another major section OR when we hit the first block definition
-            # Note: We continue past '---' separators as they're just visual dividers within the arguments
-            if (in_arguments_section and 
-                ((line_stripped.startswith('## ') and not re.match(r'^##\s+(Arguments?\s+Reference|Argument\s+Reference)', line_stripped, re.IGNORECASE)) or
-                 re.match(r'^(?:A|An|The)\s+`[^`]+`\s+block\s+supports\s+the\s+following:', line_stripped, re.IGNORECASE))):
-                break
-            
-            if in_arguments_section and line_stripped:
-                # Look for argument definitions (start with * or -)
-                arg_match = re.match(r'^[\*\-]\s*`([^`]+)`\s*[-–—]\s*(.+)', line_stripped)
-                if arg_match:
-                    arg_name = arg_match.group(1).strip()
-                    description = arg_match.group(2).strip()
-                    
-                    # Determine if required
-                    required = "(Required)" in description or "(required)" in description
-                    
-                    # Clean up description by removing required/optional indicators
-                    cleaned_description = re.sub(r'\s*\((?:Required|Optional)\)\s*[-–—]?\s*', '', description, flags=re.IGNORECASE).strip()
-                    # Remove leading dash if it remains after cleanup
-                    cleaned_description = re.sub(r'^[-–—]\s*', '', cleaned_description).strip()
-                    
-                    # Determine if this is a block argument
-                    is_block = "block" in cleaned_description.lower()
-                    
-                    # Determine type
-                    if is_block:
-                        arg_type = "Block"
-                    else:
-                        arg_type = "Single"
-                    
-                    arg_detail = ArgumentDetail(
-                        name=arg_name,
-                        description=cleaned_description,
-                        required=required,
-                        type=arg_type,
-                        block_arguments=[] if is_block else None
-                    )
-                    
-                    arguments.append(arg_detail)
-        
-        # Second pass: Find block definitions and populate nested arguments
-        block_definitions = self._extract_block_definitions(markdown_content)
-        
-        # Match block definitions to arguments
-        for arg in arguments:
-            if arg.type == "Block" and arg.name in block_definitions:
-                arg.block_arguments = block_definitions[arg.name]
-                    
-        # Add common arguments if none were found
-        if not arguments:
-            if is_data_source:
-                arguments = [
-                    ArgumentDetail(
-                        name="name",
-                        description="Specifies the name of the resource to retrieve information about.",
-                        required=False,
-                        type="Single"
-                    ),
-                    ArgumentDetail(
-                        name="resource_group_name",
-                        description="The name of the resource group containing the resource.",
-                        required=False,
-                        type="Single"
-                    )
-                ]
-            else:
-                arguments = [
-                    ArgumentDetail(
-                        name="name",
-                        description="Specifies the name of the resource.",
-                        required=True,
-                        type="Single"
-                    ),
-                    ArgumentDetail(
-                        name="resource_group_name",
-                        description="The name of the resource group in which to create the resource.",
-                        required=True,
-                        type="Single"
-                    ),
-                    ArgumentDetail(
-                        name="location",
-                        description="Specifies the supported Azure location where the resource exists.",
-                        required=True,
-                        type="Single"
-                    ),
-                    ArgumentDetail(
-                        name="tags",
-                        description="A mapping of tags to assign to the resource.",
-                        required=False,
-                        type="Single"
-                    )
-                ]
-        
-        return arguments
-    
-    def _extract_block_definitions(self, markdown_content: str) -> Dict[str, List[ArgumentDetail]]:
-        """Extract block definitions from the markdown documentation."""
+        # Block definitions: "A `name` block supports the following:" and its argument list
         block_definitions = {}
-        lines = markdown_content.split('\n')
-        
         current_block_name = None
         current_block_args = []
         
+        # Attributes: the Attributes Reference section
+        attributes = [
+            {
+                "name": "id",
+                "description": "The ID of the resource."
+            }
+        ]
+        attribute_names = {"id"}
+        in_attributes_section = False
+        attributes_done = False
+        
+        # Examples: up to three hcl/terraform code blocks that use the resource
+        examples = []
+        examples_done = False
+        in_code_block = False
+        code_block_lang = None
+        current_code = []
+        block_type = "data" if is_data_source else "resource"
+        resource_name = normalized_type.replace('-', '_')
+        
+        # Notes: "NOTE:" style callouts and note-like blockquotes
+        notes = []
+        in_note_block = False
+        current_note = []
+        
         for i, line in enumerate(lines):
             line_stripped = line.strip()
+            # Most lines are prose; a cheap look at the first character decides
+            # which patterns could match at all before any regex runs
+            first_char = line_stripped[:1]
+            is_header = first_char == '#' and line_stripped.startswith('##')
+            is_section = is_header and line_stripped.startswith('## ')
+            block_header_match = _BLOCK_HEADER_RE.match(line_stripped) if first_char in _BLOCK_HEADER_START else None
+            arg_match = _ARG_LINE_RE.match(line_stripped) if first_char in _BULLET_START else None
+            
+            if summary is None:
+                if line_stripped == '---':
+                    # Track frontmatter boundaries
+                    if not in_frontmatter:
+                        in_frontmatter = True
+                    else:
+                        frontmatter_ended = True
+                elif in_frontmatter and not frontmatter_ended:
+                    # Skip frontmatter content
+                    pass
+                elif frontmatter_ended and line_stripped and not line_stripped.startswith('#'):
+                    # This is likely the description paragraph
+                    if len(line_stripped) > 20:  # Reasonable length for a description
+                        summary = line_stripped
+                elif is_header and line_stripped.lower().startswith('## description'):
+                    # Get the next non-empty line
+                    for j in range(i + 1, min(i + 5, line_count)):
+                        desc_line = lines[j].strip()
+                        if desc_line and not desc_line.startswith('#'):
+                            summary = desc_line
+                            break
+            
+            if not arguments_done:
+                if is_header and _ARGS_HEADER_RE.match(line_stripped):
+                    in_arguments_section = True
+                elif in_arguments_section:
+                    # Stop at another major section OR at the first block definition
+                    # Note: '---' separators are just visual dividers within the arguments
+                    if is_section or block_header_match:
+                        arguments_done = True
+                    elif arg_match:
+                        arguments.append(self._argument_from_match(arg_match))
             
-            # Look for block definition headers
-            block_header_match = re.match(r'^(?:A|An|The)\s+`([^`]+)`\s+block\s+supports\s+the\s+following:', line_stripped, re.IGNORECASE)
             if block_header_match:
                 # Save previous block if exists
                 if current_block_name and current_block_args:
                     block_definitions[current_block_name] = current_block_args
                 
-                # Start new block
                 current_block_name = block_header_match.group(1).strip()
                 current_block_args = []
-                continue
-            
-            # Look for end of block (indicated by ---, ## header, or empty line followed by A/An/The block)
-            if current_block_name:
-                if (line_stripped == '---' or 
-                    line_stripped.startswith('## ') or
-                    (line_stripped == '' and i + 1 < len(lines) and 
-                     re.match(r'^(?:A|An|The)\s+`[^`]+`\s+block\s+supports\s+the\s+following:', lines[i + 1].strip(), re.IGNORECASE))):
-                    
-                    # Save current block
+            elif current_block_name:
+                # A block ends at --- or a ## header; the next block header also ends it above
+                if line_stripped == '---' or is_section:
                     if current_block_args:
                         block_definitions[current_block_name] = current_block_args
                     
                     current_block_name = None
                     current_block_args = []
-                    continue
+                elif arg_match:
+                    current_block_args.append(self._argument_from_match(arg_match))
+            
+            if not attributes_done:
+                if is_header and _ATTRS_HEADER_RE.match(line_stripped):
+                    in_attributes_section = True
+                elif in_attributes_section:
+                    # Stop when we hit another major section
+                    if is_section:
+                        attributes_done = True
+                    elif arg_match:
+                        attr_name = arg_match.group(1).strip()
+                        if attr_name not in attribute_names:
+                            attribute_names.add(attr_name)
+                            attributes.append({
+                                "name": attr_name,
+                                "description": arg_match.group(2).strip()
+                            })
+            
+            if not examples_done:
+                if line_stripped.startswith('```'):
+                    if not in_code_block:
+                        in_code_block = True
+                        code_block_lang = line_stripped[3:].strip().lower()
+                        current_code = []
+                    else:
+                        in_code_block = False
+                        
+                        # Keep hcl/terraform blocks that declare the resource/data source
+                        if code_block_lang in ['hcl', 'terraform', ''] and current_code:
+                            code_text = '\n'.join(current_code).strip()
+                            if block_type in code_text and resource_name in code_text:
+                                examples.append(code_text)
+                                examples_done = len(examples) >= 3
+                        
+                        current_code = []
+                        code_block_lang = None
+                elif in_code_block:
+                    current_code.append(line)
+            
+            note_match = _NOTE_RE.match(line_stripped) if first_char in _NOTE_START else None
+            if note_match:
+                # Starting a new note; save the previous one
+                if current_note:
+                    notes.append(' '.join(current_note))
                 
-                # Look for argument definitions within block
-                arg_match = re.match(r'^[\*\-]\s*`([^`]+)`\s*[-–—]\s*(.+)', line_stripped)
-                if arg_match:
-                    arg_name = arg_match.group(1).strip()
-                    description = arg_match.group(2).strip()
-                    
-                    # Determine if required
-                    required = "(Required)" in description or "(required)" in description
-                    
-                    # Clean up description by removing required/optional indicators
-                    cleaned_description = re.sub(r'\s*\((?:Required|Optional)\)\s*[-–—]?\s*', '', description, flags=re.IGNORECASE).strip()
-                    # Remove leading dash if it remains after cleanup
-                    cleaned_description = re.sub(r'^[-–—]\s*', '', cleaned_description).strip()
-                    
-                    # Determine if this nested argument is also a block
-                    is_nested_block = "block" in cleaned_description.lower()
-                    
-                    arg_detail = ArgumentDetail(
-                        name=arg_name,
-                        description=cleaned_description,
-                        required=required,
-                        type="Block" if is_nested_block else "Single",
-                        block_arguments=[] if is_nested_block else None
-                    )
-                    
-                    current_block_args.append(arg_detail)
+                note_content = note_match.group(1).strip()
+                current_note = [note_content] if note_content else []
+                in_note_block = True
+            elif in_note_block and (
+                line_stripped.startswith(('>', '->', '~>')) or
+                (line_stripped and line.startswith('  ') and not line_stripped.startswith('*')) or
+                (line_stripped and not line_stripped.startswith(('#', '*', '-')) and len(line_stripped) < 100)
+            ):
+                # Continue the note block
+                clean_line = line_stripped.lstrip('~> ').lstrip('-> ').lstrip('> ').strip()
+                if clean_line:
+                    current_note.append(clean_line)
+            else:
+                if in_note_block:
+                    # End of note block
+                    if current_note:
+                        notes.append(' '.join(current_note))
+                        current_note = []
+                    in_note_block = False
+                
+                # Blockquotes mentioning a note keyword are collected as notes too
+                if line_stripped.startswith(('>', '->', '~>')):
+                    clean_line = line_stripped.lstrip('~> ').lstrip('-> ').lstrip('> ').strip()
+                    if any(keyword in clean_line.lower() for keyword in ['note', 'important', 'warning', 'caution']):
+                        if clean_line:
+                            current_note = [clean_line]
+                            in_note_block = True
         
-        # Handle the last block if exists
+        # Handle the last block and note if they exist
         if current_block_name and current_block_args:
             block_definitions[current_block_name] = current_block_args
+        if current_note:
+            notes.append(' '.join(current_note))
+        
+        # Match block definitions to arguments
+        for arg in arguments:
+            if arg.type == "Block" and arg.name in block_definitions:
+                arg.block_arguments = block_definitions[arg.name]
         
-        return block_definitions
+        if summary is None:
+            summary = self._generate_default_summary(resource_type, is_data_source)
+        if not arguments:
+            arguments = self._get_default_arguments(is_data_source)
+        if len(attributes) == 1:  # Only has the default 'id' attribute
+            attributes.extend(self._get_known_attributes())
+        if not examples:
+            examples.append(self._generate_default_example(normalized_type, is_data_source))
+        
+        return summary, arguments, attributes, examples, self._clean_notes(notes)
     
-    def _extract_attributes(self, markdown_content: str) -> List[Dict[str, str]]:
-        """Extract attribute information from the markdown documentation."""
-        attributes = [
-            {
-                "name": "id",
-                "description": "The ID of the resource."
-            }
-        ]
+    def _argument_from_match(self, arg_match: re.Match) -> ArgumentDetail:
+        """Build an argument from a matched "* `name` - description" line."""
+        arg_name = arg_match.group(1).strip()
+        description = arg_match.group(2).strip()
         
-        lines = markdown_content.split('\n')
+        description_cf = description.casefold()
         
-        # Find the Attributes Reference section
-        in_attributes_section = False
-        in_block = False
-        current_block = None
+        # Determine if required, matching the case-insensitive cleanup below
+        required = "(required)" in description_cf
         
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            
-            # Look for Attributes Reference section
-            if re.match(r'^##\s+(Attributes?\s+Reference|Attribute\s+Reference)', line_stripped, re.IGNORECASE):
-                in_attributes_section = True
-                continue
-            
-            # Stop when we hit another major section
-            if in_attributes_section and line_stripped.startswith('## ') and not re.match(r'^##\s+(Attributes?\s+Reference|Attribute\s+Reference)', line_stripped, re.IGNORECASE):
-                break
-            
-            if in_attributes_section:
-                # Look for attribute definitions (usually start with * or -)
-                if re.match(r'^[\*\-]\s*`([^`]+)`', line_stripped):
-                    match = re.match(r'^[\*\-]\s*`([^`]+)`\s*[-–—]\s*(.+)', line_stripped)
-                    if match:
-                        attr_name = match.group(1).strip()
-                        description = match.group(2).strip()
-                        
-                        # Skip if already exists
-                        if not any(attr['name'] == attr_name for attr in attributes):
-                            attributes.append({
-                                "name": attr_name,
-                                "description": description
-                            })
-                
-                # Look for nested block attributes (indented)
-                elif re.match(r'^\s+[\*\-]\s*`([^`]+)`', line_stripped):
-                    match = re.match(r'^\s+[\*\-]\s*`([^`]+)`\s*[-–—]\s*(.+)', line_stripped)
-                    if match and current_block:
-                        nested_attr = match.group(1).strip()
-                        nested_desc = match.group(2).strip()
-                        
-                        # Add as nested attribute with block prefix
-                        if not any(attr['name'] == f"{current_block}.{nested_attr}" for attr in attributes):
-                            attributes.append({
-                                "name": f"{current_block}.{nested_attr}",
-                                "description": f"(Block attribute) {nested_desc}"
-                            })
-                
-                # Track current block context - look for block attributes first
-                if re.match(r'^[\*\-]\s*`([^`]+)`.*block', line_stripped, re.IGNORECASE):
-                    block_match = re.match(r'^[\*\-]\s*`([^`]+)`', line_stripped)
-                    if block_match:
-                        current_block = block_match.group(1).strip()
+        # Clean up description by removing required/optional indicators
+        cleaned_description = _REQ_OPT_RE.sub('', description).strip()
+        # Remove leading dash if it remains after cleanup
+        cleaned_description = _LEAD_DASH_RE.sub('', cleaned_description).strip()
         
-        # If no attributes were extracted, provide known attributes for common Azure resources
-        if len(attributes) == 1:  # Only has the default 'id' attribute
-            attributes.extend(self._get_known_attributes())
+        # Determine if this is a block argument
+        is_block = "block" in description_cf
+        
+        return ArgumentDetail(
+            name=arg_name,
+            description=cleaned_description,
+            required=required,
+            type="Block" if is_block else "Single",
+            block_arguments=[] if is_block else None
+        )
+    
+    def _generate_default_summary(self, resource_type: str, is_data_source: bool) -> str:
+        """Generate a default summary based on resource type and whether it's a data source."""
+        resource_display_name = resource_type.replace('_', ' ').title()
         
-        return attributes
+        if is_data_source:
+            return f"Use this data source to access information about an existing {resource_display_name}."
+        else:
+            return f"Manages an Azure {resource_display_name} resource."
+    
+    def _get_default_arguments(self, is_data_source: bool) -> List[ArgumentDetail]:
+        """Get the common arguments used when a page lists none."""
+        if is_data_source:
+            return [
+                ArgumentDetail(
+                    name="name",
+                    description="Specifies the name of the resource to retrieve information about.",
+                    required=False,
+                    type="Single"
+                ),
+                ArgumentDetail(
+                    name="resource_group_name",
+                    description="The name of the resource group containing the resource.",
+                    required=False,
+                    type="Single"
+                )
+            ]
+        else:
+            return [
+                ArgumentDetail(
+                    name="name",
+                    description="Specifies the name of the resource.",
+                    required=True,
+                    type="Single"
+                ),
+                ArgumentDetail(
+                    name="resource_group_name",
+                    description="The name of the resource group in which to create the resource.",
+                    required=True,
+                    type="Single"
+                ),
+                ArgumentDetail(
+                    name="location",
+                    description="Specifies the supported Azure location where the resource exists.",
+                    required=True,
+                    type="Single"
+                ),
+                ArgumentDetail(
+                    name="tags",
+                    description="A mapping of tags to assign to the resource.",
+                    required=False,
+                    type="Single"
+                )
+            ]
     
     def _get_known_attributes(self) -> List[Dict[str, str]]:
         """Get known attributes for common Azure data sources since the registry uses JS rendering."""
@@ -440,54 +522,11 @@ class AzureRMDocumentationProvider:
             }
         ]
     
-    def _extract_examples(self, markdown_content: str, normalized_type: str, is_data_source: bool = False) -> List[str]:
-        """Extract example code from the markdown documentation."""
-        examples = []
-        lines = markdown_content.split('\n')
-        
-        # Find code blocks (```hcl or ```terraform)
-        in_code_block = False
-        current_code = []
-        code_block_lang = None
-        
-        for line in lines:
-            # Check for code block start
-            if line.strip().startswith('```'):
-                if not in_code_block:
-                    # Starting a code block
-                    in_code_block = True
-                    code_block_lang = line.strip()[3:].strip().lower()
-                    current_code = []
-                else:
-                    # Ending a code block
-                    in_code_block = False
-                    
-                    # Check if this is a relevant code block
-                    if code_block_lang in ['hcl', 'terraform', ''] and current_code:
-                        code_text = '\n'.join(current_code).strip()
-                        
-                        # Check if it contains the resource/data source
-                        block_type = "data" if is_data_source else "resource"
-                        resource_name = normalized_type.replace('-', '_')
-                        
-                        if (block_type in code_text and 
-                            (f"azurerm_{resource_name}" in code_text or 
-                             f'"{resource_name}"' in code_text or
-                             resource_name in code_text)):
-                            examples.append(code_text)
-                            if len(examples) >= 3:  # Limit to 3 examples
-                                break
-                    
-                    current_code = []
-                    code_block_lang = None
-            elif in_code_block:
-                current_code.append(line)
-        
-        # If no examples found, generate a basic one
-        if not examples:
-            resource_name = normalized_type.replace('-', '_')
-            if is_data_source:
-                examples.append(f'''data "azurerm_{resource_name}" "example" {{
+    def _generate_default_example(self, normalized_type: str, is_data_source: bool) -> str:
+        """Generate a basic example when a page has none for the resource."""
+        resource_name = normalized_type.replace('-', '_')
+        if is_data_source:
+            return f'''data "azurerm_{resource_name}" "example" {{
   name                = "example-{normalized_type}"
   resource_group_name = "example-resource-group"
 }}
@@ -495,9 +534,9 @@ class AzureRMDocumentationProvider:
 # Use the data source
 output "{resource_name}_id" {{
   value = data.azurerm_{resource_name}.example.id
-}}''')
-            else:
-                examples.append(f'''resource "azurerm_{resource_name}" "example" {{
+}}'''
+        else:
+            return f'''resource "azurerm_{resource_name}" "example" {{
   name                = "example-{normalized_type}"
   resource_group_name = azurerm_resource_group.example.name
   location            = azurerm_resource_group.example.location
@@ -505,111 +544,19 @@ output "{resource_name}_id" {{
   tags = {{
     Environment = "Development"
   }}
-}}''')
-        
-        return examples
+}}'''
     
-    def _extract_notes(self, markdown_content: str) -> List[str]:
-        """Extract note sections from the markdown documentation."""
-        notes = []
-        lines = markdown_content.split('\n')
-        
-        in_note_block = False
-        current_note = []
-        
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            
-            # Look for note indicators - various patterns used in Terraform docs
-            note_patterns = [
-                r'^>\s*\*\*NOTE:?\*\*\s*(.*)$',  # > **NOTE:** content
-                r'^>\s*\*\*Note:?\*\*\s*(.*)$',  # > **Note:** content  
-                r'^>\s*NOTE:?\s*(.*)$',           # > NOTE: content
-                r'^>\s*Note:?\s*(.*)$',           # > Note: content
-                r'^->\s*\*\*NOTE:?\*\*\s*(.*)$', # -> **NOTE:** content
-                r'^->\s*\*\*Note:?\*\*\s*(.*)$', # -> **Note:** content
-                r'^->\s*NOTE:?\s*(.*)$',          # -> NOTE: content
-                r'^->\s*Note:?\s*(.*)$',          # -> Note: content
-                r'^~>\s*\*\*NOTE:?\*\*\s*(.*)$', # ~> **NOTE:** content
-                r'^~>\s*\*\*Note:?\*\*\s*(.*)$', # ~> **Note:** content
-                r'^~>\s*NOTE:?\s*(.*)$',          # ~> NOTE: content
-                r'^~>\s*Note:?\s*(.*)$',          # ~> Note: content
-                r'^\*\*NOTE:?\*\*\s*(.*)$',      # **NOTE:** content
-                r'^\*\*Note:?\*\*\s*(.*)$',      # **Note:** content
-                r'^NOTE:?\s*(.*)$',               # NOTE: content
-                r'^Note:?\s*(.*)$'                # Note: content
-            ]
-            
-            # Check if this line starts a note
-            note_match = None
-            for pattern in note_patterns:
-                match = re.match(pattern, line_stripped, re.IGNORECASE)
-                if match:
-                    note_match = match
-                    break
-            
-            if note_match:
-                # Starting a new note
-                if current_note:
-                    # Save previous note if exists
-                    note_text = ' '.join(current_note).strip()
-                    if note_text:
-                        notes.append(note_text)
-                
-                # Start new note with the content after the note indicator
-                note_content = note_match.group(1).strip() if note_match.lastindex else ""
-                current_note = [note_content] if note_content else []
-                in_note_block = True
-                continue
-            
-            # Check if we're continuing a note block (starts with >, ->, ~>, or indented)
-            if in_note_block:
-                if (line_stripped.startswith('>') or line_stripped.startswith('->') or line_stripped.startswith('~>') or
-                    (line_stripped and line.startswith('  ') and not line_stripped.startswith('*')) or
-                    (line_stripped and not line_stripped.startswith('#') and not line_stripped.startswith('*') and 
-                     not line_stripped.startswith('-') and len(line_stripped) < 100)):
-                    
-                    # Continue the note - clean up markdown formatting
-                    clean_line = line_stripped.lstrip('~> ').lstrip('-> ').lstrip('> ').strip()
-                    if clean_line:
-                        current_note.append(clean_line)
-                    continue
-                else:
-                    # End of note block
-                    if current_note:
-                        note_text = ' '.join(current_note).strip()
-                        if note_text:
-                            notes.append(note_text)
-                        current_note = []
-                    in_note_block = False
-            
-            # Look for blockquote-style notes (multiple lines starting with >, ->, or ~>)
-            if (line_stripped.startswith('>') or line_stripped.startswith('->') or line_stripped.startswith('~>')) and not in_note_block:
-                # Check if this might be a note by looking for note keywords
-                clean_content = line_stripped.lstrip('~> ').lstrip('-> ').lstrip('> ').strip().lower()
-                if any(keyword in clean_content for keyword in ['note', 'important', 'warning', 'caution']):
-                    # Start collecting this as a potential note
-                    clean_line = line_stripped.lstrip('~> ').lstrip('-> ').lstrip('> ').strip()
-                    if clean_line:
-                        current_note = [clean_line]
-                        in_note_block = True
-        
-        # Handle the last note if exists
-        if current_note:
-            note_text = ' '.join(current_note).strip()
-            if note_text:
-                notes.append(note_text)
-        
-        # Clean up notes - remove markdown formatting and duplicates
+    def _clean_notes(self, notes: List[str]) -> List[str]:
+        """Strip markdown formatting from notes and drop short ones and duplicates."""
         cleaned_notes = []
         seen_notes = set()
         
         for note in notes:
             # Remove markdown formatting
-            cleaned_note = re.sub(r'\*\*(.*?)\*\*', r'\1', note)  # Remove **bold**
-            cleaned_note = re.sub(r'\*(.*?)\*', r'\1', cleaned_note)  # Remove *italic*
-            cleaned_note = re.sub(r'`(.*?)`', r'\1', cleaned_note)  # Remove `code`
-            cleaned_note = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', cleaned_note)  # Remove [text](link)
+            cleaned_note = _MD_BOLD_RE.sub(r'\1', note)  # Remove **bold**
+            cleaned_note = _MD_ITALIC_RE.sub(r'\1', cleaned_note)  # Remove *italic*
+            cleaned_note = _MD_CODE_RE.sub(r'\1', cleaned_note)  # Remove `code`
+            cleaned_note = _MD_LINK_RE.sub(r'\1', cleaned_note)  # Remove [text](link)
             cleaned_note = cleaned_note.strip()
             
             # Skip very short notes or duplicates
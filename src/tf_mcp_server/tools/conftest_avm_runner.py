@@ -547,7 +547,8 @@ exception contains rules if {
                     'summary': {'total_violations': 0, 'failures': 0, 'warnings': 0}
                 }
             
-            # Initialize Terraform in the workspace folder
+            # Initialize Terraform in the workspace folder; the user may have changed
+            # providers or modules since the last init, and re-running init is safe
             init_result = subprocess.run(['terraform', 'init'], 
                                        cwd=str(workspace_path),
                                        capture_output=True, 
@@ -692,22 +693,22 @@ exception contains rules if {
                         'summary': {'total_violations': 0, 'failures': 0, 'warnings': 0}
                     }
                 
-                # Initialize Terraform if not already initialized
-                if not (workspace_path / '.terraform').exists():
-                    init_result = subprocess.run(['terraform', 'init'], 
-                                               cwd=str(workspace_path),
-                                               capture_output=True, 
-                                               text=True, 
-                                               timeout=120)
-                    
-                    if init_result.returncode != 0:
-                        error_message = strip_ansi_escape_sequences(init_result.stderr)
-                        return {
-                            'success': False,
-                            'error': f'Terraform init failed in workspace folder: {error_message}',
-                            'violations': [],
-                            'summary': {'total_violations': 0, 'failures': 0, 'warnings': 0}
-                        }
+                # Initialize Terraform in the workspace folder; the user may have changed
+                # providers or modules since the last init, and re-running init is safe
+                init_result = subprocess.run(['terraform', 'init'], 
+                                           cwd=str(workspace_path),
+                                           capture_output=True, 
+                                           text=True, 
+                                           timeout=120)
+                
+                if init_result.returncode != 0:
+                    error_message = strip_ansi_escape_sequences(init_result.stderr)
+                    return {
+                        'success': False,
+                        'error': f'Terraform init failed in workspace folder: {error_message}',
+                        'violations': [],
+                        'summary': {'total_violations': 0, 'failures': 0, 'warnings': 0}
+                    }
                 
                 # Create Terraform plan
                 plan_result = subprocess.run(['terraform', 'plan', '-out=tfplan.binary'], 
@@ -2,10 +2,12 @@
 Comprehensive test cases for AVM documentation provider.
 """
 
+import io
 import pytest
 import json
 import re
 import os
+import time
 
 from src.tf_mcp_server.tools.avm_docs_provider import AzureVerifiedModuleDocumentationProvider, Constants
 
@@ -299,4 +301,185 @@ class TestAzureVerifiedModuleDocumentationProviderIntegration:
             if "401" in str(e) or "Unauthorized" in str(e):
                 pytest.skip(f"GitHub API authentication failed: {e}")
             else:
-                raise
\ No newline at end of file
+                raise
+
+AVAILABLE_MODULES_CSV = (
+    "ModuleName,Description,ModuleStatus,RepoURL\n"
+    "avm-res-storage-storageaccount,Storage Account,Available,https://github.com/Azure/terraform-azurerm-avm-res-storage-storageaccount\n"
+    "avm-res-proposed-thing,Proposed module,Proposed,https://github.com/Azure/terraform-azurerm-avm-res-proposed-thing\n"
+    "\n"
+)
+
+
+class TestAzureVerifiedModuleDocumentationProviderCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Constants, "LOCAL_DATA_BASE_PATH", str(tmp_path))
+        (tmp_path / Constants.AVAILABLE_MODULE_FILE).write_text(AVAILABLE_MODULES_CSV, encoding="utf-8")
+        return tmp_path
+
+    def test_module_collection_parses_local_csv(self):
+        modules = AzureVerifiedModuleDocumentationProvider()._module_collection()
+
+        assert list(modules) == ["avm-res-storage-storageaccount"]
+        assert modules["avm-res-storage-storageaccount"][Constants.MODULE_SOURCE_FIELD] == "Azure/avm-res-storage-storageaccount/azurerm"
+
+    def test_module_collection_revalidates_expired_cache_with_etag(self, cache_dir):
+        class FakeResponse:
+            def __init__(self, status_code, text=""):
+                self.status_code = status_code
+                self.raw = io.BytesIO(text.encode("utf-8"))
+                self.headers = {"ETag": '"v1"'}
+
+            def raise_for_status(self):
+                pass
+
+            def close(self):
+                pass
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+
+            def get(self, url, headers=None, **kwargs):
+                self.calls.append(headers)
+                return FakeResponse(304) if headers else FakeResponse(200, AVAILABLE_MODULES_CSV)
+
+        cache_file = cache_dir / Constants.AVAILABLE_MODULE_FILE
+        expired = time.time() - Constants.CACHE_EXPIRATION_SECONDS - 60
+        provider = AzureVerifiedModuleDocumentationProvider()
+        provider._session = FakeSession()
+
+        os.utime(cache_file, (expired, expired))
+        provider._module_collection()
+        provider._cache_loaded_at = 0.0
+        os.utime(cache_file, (expired, expired))
+        modules = provider._module_collection()
+
+        assert provider._session.calls == [{}, {"If-None-Match": '"v1"'}]
+        assert "avm-res-storage-storageaccount" in modules
+        assert time.time() - cache_file.stat().st_mtime < 60
+
+    def test_module_collection_streams_download_into_cache(self, cache_dir):
+        class FakeResponse:
+            status_code = 200
+            headers = {}
+
+            def __init__(self, raw):
+                self.raw = raw
+
+            def raise_for_status(self):
+                pass
+
+        class FakeSession:
+            def __init__(self, body):
+                self.body = body
+
+            def get(self, url, headers=None, stream=False):
+                assert stream
+                return FakeResponse(io.BytesIO(self.body))
+
+        cache_file = cache_dir / Constants.AVAILABLE_MODULE_FILE
+        cache_file.unlink()
+        csv_with_quoted_newline = AVAILABLE_MODULES_CSV + 'avm-res-multi,"Line one\nline two",Available,https://github.com/Azure/terraform-azurerm-avm-res-multi\n'
+        provider = AzureVerifiedModuleDocumentationProvider()
+        provider._session = FakeSession(csv_with_quoted_newline.encode("utf-8"))
+
+        modules = provider._module_collection()
+
+        assert modules["avm-res-multi"][Constants.MODULE_DESCRIPTION_FIELD] == "Line one\nline two"
+        assert cache_file.read_text(encoding="utf-8") == csv_with_quoted_newline
+
+        provider._session = FakeSession(b"not,a,module,index\n")
+        provider._cache_loaded_at = 0.0
+        expired = time.time() - Constants.CACHE_EXPIRATION_SECONDS - 60
+        os.utime(cache_file, (expired, expired))
+        with pytest.raises(Exception):
+            provider._module_collection()
+
+        # A failed download leaves the previous cache file in place
+        assert cache_file.read_text(encoding="utf-8") == csv_with_quoted_newline
+        assert not (cache_dir / f"{Constants.AVAILABLE_MODULE_FILE}.tmp").exists()
+
+    def test_available_modules_is_compact_unless_pretty(self):
+        provider = AzureVerifiedModuleDocumentationProvider()
+
+        compact = provider.available_modules()
+        pretty = provider.available_modules(pretty=True)
+
+        assert "\n" not in compact
+        assert pretty.startswith("[\n  {")
+        assert json.loads(compact) == json.loads(pretty)
+        assert json.loads(compact)[0]["module_name"] == "avm-res-storage-storageaccount"
+
+    def test_module_collection_reuses_parsed_modules(self, cache_dir):
+        provider = AzureVerifiedModuleDocumentationProvider()
+        first = provider._module_collection()
+        (cache_dir / Constants.AVAILABLE_MODULE_FILE).unlink()
+
+        assert provider._module_collection() is first
+
+
+def test_download_module_version_extracts_streamed_tarball(tmp_path, monkeypatch):
+    import io
+    import tarfile
+
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+        root = tarfile.TarInfo("Azure-terraform-azurerm-avm-res-example-abc123")
+        root.type = tarfile.DIRTYPE
+        tar.addfile(root)
+        for name in ("variables.tf", "modules/child/main.tf"):
+            content = b'variable "name" {}\n'
+            info = tarfile.TarInfo(f"Azure-terraform-azurerm-avm-res-example-abc123/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    archive.seek(0)
+
+    class FakeResponse:
+        raw = archive
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        def get(self, *args, **kwargs):
+            return FakeResponse()
+
+    monkeypatch.setattr(AzureVerifiedModuleDocumentationProvider, "_session", FakeSession())
+    monkeypatch.setattr(AzureVerifiedModuleDocumentationProvider, "_get_header", staticmethod(lambda: {}))
+    target = tmp_path / "module" / "1.0.0"
+
+    AzureVerifiedModuleDocumentationProvider._download_module_version("https://example.invalid/tarball", str(target))
+
+    assert sorted(os.listdir(target)) == ["modules", "variables.tf"]
+    assert (target / "modules" / "child" / "main.tf").is_file()
+
+
+def test_read_tf_files_filters_by_prefix(tmp_path):
+    (tmp_path / "variables.tf").write_text('variable "a" {}')
+    (tmp_path / "outputs.tf").write_text('output "b" {}')
+    (tmp_path / "variables.md").write_text("docs")
+
+    assert AzureVerifiedModuleDocumentationProvider._read_tf_files(str(tmp_path), "variable") == 'variable "a" {}\n'
+    assert AzureVerifiedModuleDocumentationProvider._read_tf_files(str(tmp_path), "output") == 'output "b" {}\n'
+
+
+def test_get_header_is_cached_until_unauthorized(monkeypatch):
+    import requests
+
+    provider_cls = AzureVerifiedModuleDocumentationProvider
+    provider_cls._get_header.cache_clear()
+    monkeypatch.setenv("GITHUB_TOKEN", "first")
+    assert provider_cls._get_header()["Authorization"] == "Bearer first"
+
+    monkeypatch.setenv("GITHUB_TOKEN", "second")
+    assert provider_cls._get_header()["Authorization"] == "Bearer first"
+
+    unauthorized = requests.Response()
+    unauthorized.status_code = 401
+    with pytest.raises(requests.HTTPError):
+        provider_cls._raise_for_status(unauthorized)
+    assert provider_cls._get_header()["Authorization"] == "Bearer second"
+    provider_cls._get_header.cache_clear()
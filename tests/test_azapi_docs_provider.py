@@ -0,0 +1,116 @@
+"""
+Test cases for AzAPI documentation provider.
+"""
+
+import pytest
+import httpx
+from functools import partial
+
+from tf_mcp_server.tools import azapi_docs_provider
+from tf_mcp_server.tools.azapi_docs_provider import AzAPIDocumentationProvider
+
+
+SAMPLE_SCHEMA = {
+    "Microsoft.Storage/storageAccounts/blobServices": {"type": "object"},
+    "Microsoft.Storage/storageAccounts": {"type": "object"},
+    "Microsoft.KeyVault/vaults": {"type": "object"},
+}
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setattr(azapi_docs_provider, "load_azapi_schema", lambda: dict(SAMPLE_SCHEMA))
+    return AzAPIDocumentationProvider()
+
+
+class TestAzAPIDocumentationProvider:
+    """Test class for AzAPI documentation provider."""
+
+    @pytest.mark.asyncio
+    async def test_online_lookups_share_one_client(self, provider, monkeypatch):
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200)
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(azapi_docs_provider, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+        client = provider._get_client()
+
+        first = await provider._fetch_azapi_docs_online("Microsoft.Web/sites", "")
+        second = await provider._fetch_azapi_docs_online("Microsoft.Sql/servers", "")
+        again = await provider._fetch_azapi_docs_online("Microsoft.Web/Sites", "2023-01-01")
+
+        assert provider._get_client() is client
+        assert first["source"] == second["source"] == "Azure REST API docs"
+        # Pages that answered 200 are remembered rather than fetched again
+        assert len(requested) == 2
+        assert again["resource_type"] == "Microsoft.Web/Sites"
+        assert again["api_version"] == "2023-01-01"
+
+        await provider.aclose()
+        assert client.is_closed
+        assert provider._client is None
+
+    def test_search_prefers_exact_key_over_earlier_substring_match(self, provider):
+        result = provider._search_azapi_schema("microsoft.storage/storageaccounts")
+
+        assert result["schema_key"] == "Microsoft.Storage/storageAccounts"
+
+    def test_search_returns_first_key_containing_query(self, provider):
+        assert provider._search_azapi_schema("BLOBSERVICES")["schema_key"] == "Microsoft.Storage/storageAccounts/blobServices"
+        assert provider._search_azapi_schema("keyvault")["schema_key"] == "Microsoft.KeyVault/vaults"
+        assert provider._search_azapi_schema("accounts\nmicrosoft") == {}
+        assert provider._search_azapi_schema("Microsoft.Web/sites") == {}
+
+    @pytest.mark.asyncio
+    async def test_online_lookup_checks_page_with_head_and_follows_redirects(self, provider, monkeypatch):
+        requested = []
+
+        def handler(request):
+            requested.append((request.method, request.url.host))
+            if request.url.host == "docs.microsoft.com":
+                return httpx.Response(301, headers={"Location": "https://learn.microsoft.com" + request.url.path})
+            if request.method == "HEAD" and "sql" in request.url.path:
+                return httpx.Response(405)
+            return httpx.Response(200)
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(azapi_docs_provider, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+
+        web = await provider._fetch_azapi_docs_online("Microsoft.Web/sites", "")
+        sql = await provider._fetch_azapi_docs_online("Microsoft.Sql/servers", "")
+
+        assert web["source"] == sql["source"] == "Azure REST API docs"
+        assert requested == [
+            ("HEAD", "docs.microsoft.com"), ("HEAD", "learn.microsoft.com"),
+            ("HEAD", "docs.microsoft.com"), ("HEAD", "learn.microsoft.com"),
+            ("GET", "docs.microsoft.com"), ("GET", "learn.microsoft.com"),
+        ]
+        await provider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_schema_is_loaded_on_first_search(self, monkeypatch):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return dict(SAMPLE_SCHEMA)
+
+        monkeypatch.setattr(azapi_docs_provider, "load_azapi_schema", load)
+        provider = AzAPIDocumentationProvider()
+        assert loads == []
+
+        result = await provider.search_azapi_provider_docs("Microsoft.KeyVault/vaults")
+        await provider.search_azapi_provider_docs("Microsoft.Storage/storageAccounts")
+
+        assert result["schema"]["schema_key"] == "Microsoft.KeyVault/vaults"
+        assert loads == [1]
+
+    def test_search_results_are_cached_per_normalized_query(self, provider):
+        first = provider._search_azapi_schema("Microsoft.KeyVault/vaults")
+        provider.azapi_schema["Microsoft.KeyVault/vaults"] = {"type": "changed"}
+
+        assert provider._search_azapi_schema("microsoft.keyvault/VAULTS") is first
+        assert list(provider._schema_cache) == ["microsoft.keyvault/vaults"]
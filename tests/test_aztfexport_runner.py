@@ -8,7 +8,11 @@ from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 import tempfile
 import json
+import os
+import shlex
+import sys
 
+from tf_mcp_server.tools import aztfexport_runner
 from tf_mcp_server.tools.aztfexport_runner import (
     AztfexportRunner, 
     AztfexportProvider, 
@@ -19,6 +23,13 @@ from tf_mcp_server.tools.aztfexport_runner import (
 class TestAztfexportRunner:
     """Test cases for AztfexportRunner class."""
     
+    @pytest.fixture(autouse=True)
+    def reset_process_caches(self, monkeypatch):
+        """Start every test without cached binary paths or installation info."""
+        monkeypatch.setattr(aztfexport_runner, '_AZTFEXPORT_BIN', None)
+        monkeypatch.setattr(aztfexport_runner, '_TERRAFORM_BIN', None)
+        monkeypatch.setattr(aztfexport_runner, '_INSTALLATION_INFO', None)
+    
     @pytest.fixture
     def runner(self):
         """Create a runner instance for testing."""
@@ -59,35 +70,71 @@ class TestAztfexportRunner:
     @pytest.mark.asyncio
     async def test_run_command_success(self, runner):
         """Test successful command execution."""
-        with patch('asyncio.create_subprocess_exec') as mock_exec:
-            # Mock successful process
-            mock_process = Mock()
-            mock_process.communicate = AsyncMock(return_value=(b'success output', b''))
-            mock_process.returncode = 0
-            mock_exec.return_value = mock_process
-            
-            result = await runner._run_command(['echo', 'test'])
-            
-            assert result['exit_code'] == 0
-            assert result['stdout'] == 'success output'
-            assert result['stderr'] == ''
-            assert result['command'] == 'echo test'
+        command = [sys.executable, '-c', 'print("success output", end="")']
+        
+        result = await runner._run_command(command)
+        
+        assert result['exit_code'] == 0
+        assert result['stdout'] == 'success output'
+        assert result['stderr'] == ''
+        assert result['command'] == tuple(command)
     
     @pytest.mark.asyncio
     async def test_run_command_failure(self, runner):
         """Test command execution failure."""
-        with patch('asyncio.create_subprocess_exec') as mock_exec:
-            # Mock failed process
-            mock_process = Mock()
-            mock_process.communicate = AsyncMock(return_value=(b'', b'error output'))
-            mock_process.returncode = 1
-            mock_exec.return_value = mock_process
-            
-            result = await runner._run_command(['false'])
-            
-            assert result['exit_code'] == 1
-            assert result['stdout'] == ''
-            assert result['stderr'] == 'error output'
+        command = [sys.executable, '-c', 'import sys; sys.stderr.write("error output"); sys.exit(1)']
+        
+        result = await runner._run_command(command)
+        
+        assert result['exit_code'] == 1
+        assert result['stdout'] == ''
+        assert result['stderr'] == 'error output'
+    
+    @pytest.mark.asyncio
+    async def test_run_command_large_multibyte_output(self, runner):
+        """Test that output spanning many read chunks decodes intact."""
+        # 3-byte characters, so chunk boundaries fall inside characters
+        command = [sys.executable, '-c', 'import sys; sys.stdout.buffer.write("\u2500".encode() * 100000)']
+        
+        result = await runner._run_command(command)
+        
+        assert result['exit_code'] == 0
+        assert result['stdout'] == '\u2500' * 100000
+    
+    @pytest.mark.asyncio
+    async def test_run_command_limits_concurrent_processes(self):
+        """Test that no more than max_concurrent_commands processes run at once."""
+        with patch('tf_mcp_server.tools.aztfexport_runner.shutil.which', return_value='/usr/bin/tool'):
+            runner = AztfexportRunner(max_concurrent_commands=2)
+        
+        running = 0
+        peak = 0
+        real_exec = asyncio.create_subprocess_exec
+        
+        async def counting_exec(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            process = await real_exec(*args, **kwargs)
+            real_wait = process.wait
+            
+            async def wait():
+                nonlocal running
+                code = await real_wait()
+                await asyncio.sleep(0.01)
+                running -= 1
+                return code
+            
+            process.wait = wait
+            return process
+        
+        with patch('asyncio.create_subprocess_exec', side_effect=counting_exec):
+            results = await asyncio.gather(*(
+                runner._run_command([sys.executable, '-c', 'pass']) for _ in range(5)
+            ))
+        
+        assert [r['exit_code'] for r in results] == [0] * 5
+        assert peak == 2
     
     @pytest.mark.asyncio
     async def test_run_command_exception(self, runner):
@@ -123,6 +170,17 @@ class TestAztfexportRunner:
             assert 'aztfexport version 0.18.0' in result['aztfexport_version']
             assert 'Terraform v1.5.0' in result['terraform_version']
             assert result['status'] == 'Ready to use'
+            
+            # A second check within the TTL does not spawn the binaries again
+            assert await runner.check_installation() == result
+            assert mock_run.call_count == 2
+    
+    def test_dependency_paths_are_resolved_once(self, runner):
+        """Test that later runners reuse the resolved binary paths."""
+        with patch('tf_mcp_server.tools.aztfexport_runner.shutil.which') as mock_which:
+            AztfexportRunner()
+            
+            mock_which.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_check_installation_failure(self, runner):
@@ -152,7 +210,7 @@ class TestAztfexportRunner:
                 'exit_code': 0,
                 'stdout': 'Export completed successfully',
                 'stderr': '',
-                'command': 'aztfexport resource ...'
+                'command': ('aztfexport', 'resource', '...')
             }
             
             mock_read.return_value = {
@@ -177,7 +235,7 @@ class TestAztfexportRunner:
                 'exit_code': 1,
                 'stdout': '',
                 'stderr': 'Resource not found',
-                'command': 'aztfexport resource ...'
+                'command': ('aztfexport', 'resource', '...')
             }
             
             result = await runner.export_resource(resource_id)
@@ -198,7 +256,7 @@ class TestAztfexportRunner:
                 'exit_code': 0,
                 'stdout': 'Exported 5 resources successfully',
                 'stderr': '',
-                'command': 'aztfexport resource-group ...'
+                'command': ('aztfexport', 'resource-group', '...')
             }
             
             mock_read.return_value = {
@@ -224,7 +282,7 @@ class TestAztfexportRunner:
                 'exit_code': 0,
                 'stdout': 'Query exported 3 resources',
                 'stderr': '',
-                'command': 'aztfexport query ...'
+                'command': ('aztfexport', 'query', '...')
             }
             
             mock_read.return_value = {
@@ -236,6 +294,7 @@ class TestAztfexportRunner:
             
             assert result['success'] is True
             assert result['exit_code'] == 0
+            assert result['command'] == 'aztfexport query ...'
     
     @pytest.mark.asyncio
     async def test_export_with_azapi_provider(self, runner):
@@ -249,7 +308,7 @@ class TestAztfexportRunner:
                 'exit_code': 0,
                 'stdout': 'Export completed with azapi provider',
                 'stderr': '',
-                'command': 'aztfexport resource --provider-name azapi ...'
+                'command': ('aztfexport', 'resource', '--provider-name', 'azapi', '...')
             }
             
             mock_read.return_value = {'main.tf': 'azapi resources...'}
@@ -260,7 +319,35 @@ class TestAztfexportRunner:
             )
             
             assert result['success'] is True
-            assert 'azapi' in result['command']
+            assert result['command'] == 'aztfexport resource --provider-name azapi ...'
+    
+    @pytest.mark.asyncio
+    async def test_export_commands(self, runner, tmp_path):
+        """Test the aztfexport command line built for each export type."""
+        with patch.object(runner, '_run_command') as mock_run, \
+             patch.object(runner, '_get_output_directory', return_value=tmp_path):
+            mock_run.return_value = {'exit_code': 1, 'stdout': '', 'stderr': '', 'command': ()}
+            
+            await runner.export_resource('/sub/rid', resource_name='res', dry_run=True)
+            await runner.export_resource_group(
+                'rg', provider=AztfexportProvider.AZAPI, type_pattern='t*',
+                include_role_assignment=True, parallelism=4, continue_on_error=True
+            )
+            await runner.export_query("type =~ 'x'", name_pattern='n-*')
+            
+            commands = [call.args[0] for call in mock_run.call_args_list]
+            mock_run.return_value = {'exit_code': 1, 'stdout': '', 'stderr': '', 'command': tuple(commands[2])}
+            result = await runner.export_query("type =~ 'x'", name_pattern='n-*')
+            assert shlex.split(result['command']) == commands[2]
+            assert commands == [
+                ['/usr/bin/aztfexport', 'resource', '--non-interactive', '--plain-ui',
+                 '--name', 'res', '--dry-run', '--parallelism', '10', '/sub/rid'],
+                ['/usr/bin/aztfexport', 'resource-group', '--non-interactive', '--plain-ui',
+                 '--provider-name', 'azapi', '--type-pattern', 't*', '--include-role-assignment',
+                 '--parallelism', '4', '--continue', 'rg'],
+                ['/usr/bin/aztfexport', 'query', '--non-interactive', '--plain-ui',
+                 '--name-pattern', 'n-*', '--parallelism', '10', "type =~ 'x'"],
+            ]
     
     @pytest.mark.asyncio
     async def test_get_config_success(self, runner):
@@ -293,6 +380,22 @@ class TestAztfexportRunner:
             assert result['success'] is True
             assert result['config'] is True  # 'true' gets parsed as JSON boolean
     
+    @pytest.mark.asyncio
+    async def test_get_config_plain_text_output(self, runner):
+        """Test that non-JSON config output is returned as stripped text."""
+        with patch.object(runner, '_run_command') as mock_run, \
+             patch('tf_mcp_server.tools.aztfexport_runner._json_loads') as mock_loads:
+            mock_run.return_value = {
+                'exit_code': 0,
+                'stdout': 'telemetry_enabled = true\ninstallation_id = abc\n',
+                'stderr': ''
+            }
+            
+            result = await runner.get_config()
+            
+            assert result['config'] == 'telemetry_enabled = true\ninstallation_id = abc'
+            mock_loads.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_set_config_success(self, runner):
         """Test successful config setting."""
@@ -321,9 +424,80 @@ class TestAztfexportRunner:
             files = await runner._read_generated_files(temp_path)
             
             assert 'main.tf' in files
-            assert 'terraform.tfstate' in files
+            assert 'terraform.tfstate' not in files  # State is only returned on request
             assert 'README.md' not in files  # Non-terraform files should be excluded
             assert files['main.tf'] == 'resource "test" "example" {}'
+            
+            files = await runner._read_generated_files(temp_path, include_state=True)
+            
+            assert files['terraform.tfstate'] == '{"version": 4}'
+    
+    @pytest.mark.asyncio
+    async def test_read_generated_files_skips_directories_and_truncates(self, runner):
+        """Test that directories are skipped and oversized files are truncated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / 'modules.tf').mkdir()
+            (temp_path / 'main.tf').write_bytes(b'resource "a" "b" {}\r\n')
+            (temp_path / 'big.json').write_bytes(b'x' * 32)
+            
+            with patch('tf_mcp_server.tools.aztfexport_runner._MAX_GENERATED_FILE_BYTES', 24):
+                files = await runner._read_generated_files(temp_path)
+            
+            assert sorted(files) == ['big.json', 'main.tf']
+            assert files['main.tf'] == 'resource "a" "b" {}\r\n'
+            assert files['big.json'] == 'x' * 24 + '\n...[truncated 8 bytes]'
+    
+    @pytest.mark.asyncio
+    async def test_read_generated_files_reports_unreadable_file(self, runner):
+        """Test that a failing read is reported for that file only."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / 'main.tf').write_text('resource "a" "b" {}')
+            (temp_path / 'import.tf').write_text('import {}')
+            
+            original = AztfexportRunner._read_generated_file
+            def read_side_effect(path):
+                if path.endswith('import.tf'):
+                    raise PermissionError("denied")
+                return original(path)
+            
+            with patch.object(AztfexportRunner, '_read_generated_file', side_effect=read_side_effect):
+                files = await runner._read_generated_files(temp_path)
+            
+            assert files['main.tf'] == 'resource "a" "b" {}'
+            assert files['import.tf'] == 'Error reading file: denied'
+    
+    @pytest.mark.asyncio
+    async def test_read_generated_files_in_inode_order(self, runner):
+        """Test that files are read one after another in inode order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ('variables.tf', 'main.tf', 'provider.tf', 'outputs.tf'):
+                (temp_path / name).write_text(name)
+            
+            read_order = []
+            original = AztfexportRunner._read_generated_file
+            def read_side_effect(path):
+                read_order.append(path)
+                return original(path)
+            
+            with patch.object(AztfexportRunner, '_read_generated_file', side_effect=read_side_effect):
+                files = await runner._read_generated_files(temp_path)
+            
+            assert read_order == sorted(read_order, key=lambda path: os.stat(path).st_ino)
+            assert files == {name: name for name in ('variables.tf', 'main.tf', 'provider.tf', 'outputs.tf')}
+    
+    def test_generate_output_folder_name(self, runner):
+        """Test generated folder names are prefixed, timestamped and distinct."""
+        names = {runner._generate_output_folder_name() for _ in range(20)}
+        
+        assert len(names) == 20
+        for name in names:
+            prefix, timestamp, suffix = name.split('_')
+            assert prefix == 'aztfexport'
+            assert timestamp.isdigit()
+            assert len(suffix) == 6 and all(c in '0123456789abcdef' for c in suffix)
     
     def test_get_installation_help(self, runner):
         """Test installation help information."""
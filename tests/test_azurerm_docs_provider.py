@@ -52,7 +52,7 @@ Manages a Linux Virtual Machine within Azure.
 ## Example Usage
 """
         
-        summary = self.provider._extract_summary(markdown_with_frontmatter, "linux_virtual_machine", False)
+        summary = self.provider._parse_markdown(markdown_with_frontmatter, "linux_virtual_machine", "linux_virtual_machine", False)[0]
         assert summary == "Manages a Linux Virtual Machine within Azure."
         
         # Test with description section
@@ -65,7 +65,7 @@ Use this data source to access information about an existing Batch Account.
 ## Example Usage
 """
         
-        summary = self.provider._extract_summary(markdown_with_description, "batch_account", True)
+        summary = self.provider._parse_markdown(markdown_with_description, "batch_account", "batch_account", True)[0]
         assert summary == "Use this data source to access information about an existing Batch Account."
     
     def test_extract_arguments_from_markdown(self):
@@ -96,7 +96,7 @@ A `os_disk` block supports the following:
 * `storage_account_type` - (Required) The Type of Storage Account which should back this the Internal OS Disk. Possible values are `Standard_LRS`, `StandardSSD_LRS`, `Premium_LRS`, `StandardSSD_ZRS` and `Premium_ZRS`.
 """
         
-        arguments = self.provider._extract_arguments(markdown_content, False)
+        arguments = self.provider._parse_markdown(markdown_content, "linux_virtual_machine", "linux_virtual_machine", False)[1]
         
         # Check that we have the main arguments
         arg_names = [arg.name for arg in arguments]
@@ -141,7 +141,7 @@ An `identity` block exports the following:
 * `tenant_id` - The Tenant ID of the System Assigned Managed Service Identity.
 """
         
-        attributes = self.provider._extract_attributes(markdown_content)
+        attributes = self.provider._parse_markdown(markdown_content, "linux_virtual_machine", "linux_virtual_machine", False)[2]
         
         # Check that we have the main attributes
         attr_names = [attr['name'] for attr in attributes]
@@ -191,14 +191,14 @@ output "vm_id" {
 ```
 """
         
-        examples = self.provider._extract_examples(markdown_content, "linux_virtual_machine", False)
+        examples = self.provider._parse_markdown(markdown_content, "linux_virtual_machine", "linux_virtual_machine", False)[3]
         
         assert len(examples) >= 1
         assert "azurerm_linux_virtual_machine" in examples[0]
         assert "resource" in examples[0]
         
         # Test data source examples
-        examples_ds = self.provider._extract_examples(markdown_content, "linux_virtual_machine", True)
+        examples_ds = self.provider._parse_markdown(markdown_content, "linux_virtual_machine", "linux_virtual_machine", True)[3]
         
         # Should pick up the data source example
         assert len(examples_ds) >= 1
@@ -206,6 +206,75 @@ output "vm_id" {
             # If it found actual examples, check they contain data source
             assert any("data" in example for example in examples_ds)
     
+    def test_parse_markdown_blocks_and_notes(self):
+        """Test that block arguments and notes are collected in the same pass."""
+        markdown_content = """
+## Arguments Reference
+
+* `name` - (Required) The name of the Storage Account.
+
+-> **NOTE:** Changing the `name` forces a new resource to be created.
+
+* `network_rules` - (Optional) A `network_rules` block as defined below.
+
+---
+
+A `network_rules` block supports the following:
+
+* `default_action` - (Required) Specifies the default action of allow or deny.
+
+## Attributes Reference
+
+* `primary_blob_endpoint` - The endpoint URL for blob storage in the primary location.
+"""
+        
+        summary, arguments, attributes, examples, notes = self.provider._parse_markdown(
+            markdown_content, "storage_account", "storage_account", False
+        )
+        
+        assert summary == "Manages an Azure Storage Account resource."
+        assert [arg.name for arg in arguments] == ["name", "network_rules"]
+        network_rules = arguments[1]
+        assert network_rules.type == "Block"
+        assert [arg.name for arg in network_rules.block_arguments] == ["default_action"]
+        assert network_rules.block_arguments[0].required == True
+        assert [attr["name"] for attr in attributes] == ["id", "primary_blob_endpoint"]
+        assert 'resource "azurerm_storage_account" "example"' in examples[0]
+        assert notes == ["Changing the name forces a new resource to be created."]
+    
+    def test_parse_markdown_required_marker_any_case(self):
+        """Test that the (Required) marker is recognised regardless of case."""
+        markdown_content = """
+## Arguments Reference
+
+* `name` - (REQUIRED) The name of the resource.
+
+* `sku` - (Optional) A `Sku` Block as defined below.
+"""
+        
+        arguments = self.provider._parse_markdown(markdown_content, "foo", "foo", False)[1]
+        
+        assert arguments[0].required == True
+        assert arguments[0].description == "The name of the resource."
+        assert arguments[1].required == False
+        assert arguments[1].type == "Block"
+    
+    def test_parse_markdown_crlf_line_endings(self):
+        """Test that pages with Windows line endings parse like Unix ones."""
+        markdown_content = (
+            "## Example Usage\r\n"
+            "\r\n"
+            "```hcl\r\n"
+            'resource "azurerm_key_vault" "example" {\r\n'
+            '  name = "example"\r\n'
+            "}\r\n"
+            "```\r\n"
+        )
+        
+        examples = self.provider._parse_markdown(markdown_content, "key_vault", "key_vault", False)[3]
+        
+        assert examples == ['resource "azurerm_key_vault" "example" {\n  name = "example"\n}']
+    
     @pytest.mark.asyncio
     async def test_search_azurerm_provider_docs_success(self):
         """Test successful documentation retrieval."""
@@ -247,7 +316,7 @@ resource "azurerm_linux_virtual_machine" "example" {
         
         with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_response
             
             result = await self.provider.search_azurerm_provider_docs(
@@ -295,7 +364,7 @@ Use this data source to access information about an existing Virtual Machine.
         
         with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             # First call returns 404, second call returns 200
             mock_client.get.side_effect = [mock_response_404, mock_response_200]
             
@@ -308,15 +377,67 @@ Use this data source to access information about an existing Virtual Machine.
             assert result.resource_type == "virtual_machine"
             assert "docs/d/" in result.documentation_url  # Should be data source URL
     
+    @pytest.mark.asyncio
+    async def test_search_azurerm_provider_docs_requests_fallback_concurrently(self):
+        """Test that the fallback URL is requested while the primary is in flight."""
+        fallback_started = asyncio.Event()
+        
+        async def get(url):
+            response = MagicMock()
+            if "/docs/r/" in url:
+                # The primary only answers once the fallback request is already out
+                await asyncio.wait_for(fallback_started.wait(), timeout=1)
+                response.status_code = 404
+            else:
+                fallback_started.set()
+                response.status_code = 200
+                response.text = "# Data Source: azurerm_virtual_machine\n"
+            return response
+        
+        with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
+            mock_client_class.return_value.get = get
+            
+            result = await self.provider.search_azurerm_provider_docs("virtual_machine")
+        
+        assert "docs/d/" in result.documentation_url
+    
+    @pytest.mark.asyncio
+    async def test_search_azurerm_provider_docs_caches_results(self):
+        """Test that a found page is served from memory on repeat and concurrent lookups."""
+        requested = []
+        
+        async def get(url):
+            requested.append(url)
+            await asyncio.sleep(0)
+            response = MagicMock()
+            response.status_code = 200
+            response.text = "# azurerm_storage_account\n"
+            return response
+        
+        with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
+            mock_client_class.return_value.get = get
+            
+            first, second = await asyncio.gather(
+                self.provider.search_azurerm_provider_docs("storage_account"),
+                self.provider.search_azurerm_provider_docs("storage_account"),
+            )
+            again = await self.provider.search_azurerm_provider_docs("storage_account", doc_type="resource")
+            data_source = await self.provider.search_azurerm_provider_docs("storage_account", doc_type="data-source")
+        
+        assert first is second is again
+        assert "docs/d/" in data_source.documentation_url
+        # One primary and one fallback request per distinct page
+        assert len(requested) == 4
+    
     @pytest.mark.asyncio
     async def test_search_azurerm_provider_docs_not_found(self):
         """Test handling when documentation is not found."""
         mock_response = MagicMock()
         mock_response.status_code = 404
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client:
             # Both calls return 404
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
             
             result = await self.provider.search_azurerm_provider_docs(
                 resource_type="non_existent_resource",
@@ -335,7 +456,7 @@ Use this data source to access information about an existing Virtual Machine.
         """Test handling when an exception occurs."""
         with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.side_effect = Exception("Network error")
             
             result = await self.provider.search_azurerm_provider_docs(
@@ -348,6 +469,26 @@ Use this data source to access information about an existing Virtual Machine.
             assert "Error retrieving documentation" in result.summary
             assert "Network error" in result.summary
     
+    @pytest.mark.asyncio
+    async def test_search_azurerm_provider_docs_reuses_client(self):
+        """Test that lookups share one pooled HTTP client."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        
+        with patch('tf_mcp_server.tools.azurerm_docs_provider.AsyncClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_response
+            
+            await self.provider.search_azurerm_provider_docs("resource_group")
+            await self.provider.search_azurerm_provider_docs("storage_account")
+            await self.provider.aclose()
+            
+            mock_client_class.assert_called_once()
+            assert mock_client.get.await_count == 4
+            mock_client.aclose.assert_awaited_once()
+    
     def test_get_azurerm_documentation_provider_singleton(self):
         """Test that the provider returns the same instance."""
         provider1 = get_azurerm_documentation_provider()
@@ -0,0 +1,391 @@
+"""
+Tests for the Terraform executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from tf_mcp_server.core.terraform_executor import TerraformExecutor, _providers_fingerprint, _strip_ansi_bytes
+
+
+AZURERM_HCL = '''
+terraform {
+  required_providers {
+    azurerm = {
+      source  = "hashicorp/azurerm"
+      version = "~>3.0"
+    }
+  }
+}
+
+resource "azurerm_resource_group" "example" {
+  name     = "rg-example"
+  location = "East US"
+}
+'''
+
+AZURERM_LOCKFILE = '''
+provider "registry.terraform.io/hashicorp/azurerm" {
+  version     = "3.117.0"
+  constraints = "~> 3.0"
+  hashes = [
+    "h1:example=",
+  ]
+}
+'''
+
+
+class RecordingExecutor(TerraformExecutor):
+    """Executor that records Terraform commands instead of running them."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.commands: List[List[str]] = []
+
+    async def _run_terraform_command(self, cmd: List[str], working_dir: str, strip_ansi: bool = True, plugin_cache: bool = False) -> Dict[str, Any]:
+        self.commands.append(cmd)
+        if cmd[0] == 'init':
+            (Path(working_dir) / '.terraform' / 'providers').mkdir(parents=True, exist_ok=True)
+            (Path(working_dir) / '.terraform.lock.hcl').write_text(AZURERM_LOCKFILE)
+        return {'exit_code': 0, 'stdout': '', 'stderr': '', 'command': ' '.join(cmd), 'status': 'success'}
+
+
+def test_providers_fingerprint_ignores_resource_bodies() -> None:
+    changed = AZURERM_HCL.replace('rg-example', 'rg-other')
+    assert _providers_fingerprint(AZURERM_HCL) == _providers_fingerprint(changed)
+
+
+def test_providers_fingerprint_tracks_provider_versions() -> None:
+    changed = AZURERM_HCL.replace('~>3.0', '~>4.0')
+    assert _providers_fingerprint(AZURERM_HCL) != _providers_fingerprint(changed)
+
+
+def test_providers_fingerprint_tracks_module_versions() -> None:
+    module = 'module "sa" {\n  source  = "Azure/avm-res-storage-storageaccount/azurerm"\n  version = "0.1.0"\n}\n'
+    base = _providers_fingerprint(AZURERM_HCL + module)
+    assert base != _providers_fingerprint(AZURERM_HCL + module.replace('0.1.0', '0.2.0'))
+    assert base != _providers_fingerprint(AZURERM_HCL + module.replace('"sa"', '"other"'))
+    assert base != _providers_fingerprint(AZURERM_HCL)
+
+
+@pytest.mark.asyncio
+async def test_validate_hcl_reuses_initialized_directory() -> None:
+    executor = RecordingExecutor()
+    try:
+        first = await executor.validate_hcl(AZURERM_HCL)
+        second = await executor.validate_hcl(AZURERM_HCL.replace('rg-example', 'rg-other'))
+    finally:
+        executor.clean_up()
+
+    assert first.is_valid and second.is_valid
+    assert [cmd[0] for cmd in executor.commands] == ['init', 'validate', 'validate']
+
+
+@pytest.mark.asyncio
+async def test_validate_hcl_drops_directory_when_init_fails() -> None:
+    class FailingInitExecutor(RecordingExecutor):
+        async def _run_terraform_command(self, cmd: List[str], working_dir: str, strip_ansi: bool = True, plugin_cache: bool = False) -> Dict[str, Any]:
+            self.commands.append(cmd)
+            return {'exit_code': 1, 'stdout': '', 'stderr': 'Error: registry unreachable', 'command': ' '.join(cmd), 'status': 'error'}
+
+    executor = FailingInitExecutor()
+    result = await executor.validate_hcl(AZURERM_HCL)
+
+    assert not result.is_valid
+    assert executor.pool.empty()
+    assert not Path(result.file_path).parent.exists()
+
+
+@pytest.mark.asyncio
+async def test_ensure_initialized_reruns_init_when_config_changes(tmp_path) -> None:
+    executor = RecordingExecutor()
+    module = 'module "sa" {\n  source  = "Azure/avm-res-storage-storageaccount/azurerm"\n  version = "0.1.0"\n}\n'
+
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL)
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL)
+    assert len(executor.commands) == 1
+
+    # A provider constraint the lock file was not resolved for
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL.replace('~>3.0', '~>4.0'))
+    assert len(executor.commands) == 2
+
+    # A module that is not installed, then installed at another version
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL + module)
+    assert len(executor.commands) == 3
+    modules_dir = tmp_path / '.terraform' / 'modules'
+    modules_dir.mkdir()
+    (modules_dir / 'modules.json').write_text(
+        '{"Modules":[{"Key":"","Source":"","Dir":"."},'
+        '{"Key":"sa","Source":"registry.terraform.io/Azure/avm-res-storage-storageaccount/azurerm",'
+        '"Version":"0.1.0","Dir":".terraform/modules/sa"}]}'
+    )
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL + module)
+    assert len(executor.commands) == 3
+    await executor._ensure_initialized(tmp_path, AZURERM_HCL + module.replace('0.1.0', '0.2.0'))
+    assert len(executor.commands) == 4
+
+
+def test_clean_output_text_strips_ansi_and_replaces_box_drawing() -> None:
+    executor = TerraformExecutor()
+    raw = "\x1b[31m│\x1b[0m Error: bad ── a -&gt; b &amp; c\x07\n"
+    assert executor._clean_output_text(raw) == "| Error: bad -- a -> b & c\n"
+
+
+@pytest.mark.asyncio
+async def test_execute_in_workspace_passes_parallelism(tmp_path) -> None:
+    executor = RecordingExecutor()
+    await executor.execute_in_workspace('plan', str(tmp_path), parallelism=30)
+    await executor.execute_in_workspace('validate', str(tmp_path), parallelism=30)
+
+    assert '-parallelism=30' in executor.commands[0]
+    assert not any(arg.startswith('-parallelism') for arg in executor.commands[1])
+
+
+@pytest.mark.asyncio
+async def test_output_terraform_parses_json_outputs(tmp_path) -> None:
+    class OutputExecutor(TerraformExecutor):
+        async def _run_terraform_command(self, cmd: List[str], working_dir: str, strip_ansi: bool = True, plugin_cache: bool = False) -> Dict[str, Any]:
+            stdout = '{"rg_name": {"sensitive": false, "type": "string", "value": "rg-example"}}'
+            return {'exit_code': 0, 'stdout': stdout, 'stderr': '', 'command': ' '.join(cmd), 'status': 'success'}
+
+    result = await OutputExecutor().output_terraform(str(tmp_path), json_format=True)
+    assert result['outputs'] == {'rg_name': 'rg-example'}
+
+
+def test_strip_ansi_bytes() -> None:
+    assert _strip_ansi_bytes(b'plain\ttext\n') == b'plain\ttext\n'
+    assert _strip_ansi_bytes(b'\x1b[1;31mError\x1b[0m\x07: \x1bMok\x1b[\x00x') == b'Error: ok[x'
+    assert _strip_ansi_bytes(b'trailing\x1b') == b'trailing'
+
+
+@pytest.mark.asyncio
+async def test_drain_stream_strips_ansi_across_chunk_boundaries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('tf_mcp_server.core.terraform_executor._READ_CHUNK', 3)
+    stream = asyncio.StreamReader()
+    stream.feed_data(b'\x1b[31mError\x1b[0m: one\n\x1b[1mtwo\x1b[0m')
+    stream.feed_eof()
+
+    output = await TerraformExecutor._drain_stream(stream, strip_ansi=True)
+    assert bytes(output) == b'Error: one\ntwo'
+
+
+@pytest.mark.asyncio
+async def test_run_terraform_command_collects_cleaned_output(tmp_path) -> None:
+    executor = TerraformExecutor()
+    executor._tf_bin = sys.executable  # stand-in binary so no Terraform install is needed
+    script = "import sys; sys.stdout.write('\\x1b[32mok\\x1b[0m \\u2500\\n'); sys.stderr.write('warn'); sys.exit(2)"
+
+    result = await executor._run_terraform_command(['-c', script], str(tmp_path))
+
+    assert result['exit_code'] == 2
+    assert result['status'] == 'error'
+    assert result['stdout'] == 'ok -\n'
+    assert result['stderr'] == 'warn'
+
+
+@pytest.mark.asyncio
+async def test_validate_hcl_batch_preserves_order() -> None:
+    executor = RecordingExecutor(max_instances=2)
+    try:
+        results = await executor.validate_hcl_batch([AZURERM_HCL, '', AZURERM_HCL])
+    finally:
+        executor.clean_up()
+
+    assert [result.is_valid for result in results] == [True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_get_instance_initializes_once_under_concurrency() -> None:
+    class CountingExecutor(TerraformExecutor):
+        init_calls = 0
+
+        async def init_tf(self) -> None:
+            CountingExecutor.init_calls += 1
+            await asyncio.sleep(0)
+            self._ready.set()
+
+    executor = CountingExecutor()
+
+    async def _use() -> TerraformExecutor:
+        async with executor.get_instance() as instance:
+            return instance
+
+    instances = await asyncio.gather(*(_use() for _ in range(5)))
+    assert all(instance is executor for instance in instances)
+    assert CountingExecutor.init_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_run_terraform_command_sets_plugin_cache_only_when_asked(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.delenv('TF_PLUGIN_CACHE_DIR', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    executor = TerraformExecutor()
+    executor._tf_bin = sys.executable
+    script = "import os, sys; sys.stdout.write(os.environ.get('TF_PLUGIN_CACHE_DIR', ''))"
+
+    workspace = await executor._run_terraform_command(['-c', script], str(tmp_path))
+    scratch = await executor._run_terraform_command(['-c', script], str(tmp_path), plugin_cache=True)
+
+    assert workspace['stdout'] == ''
+    assert scratch['stdout'] == str(tmp_path / 'cache' / 'tf-mcp-server' / 'plugin-cache')
+    assert executor._plugin_cache.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.asyncio
+async def test_run_terraform_command_raw_output(tmp_path) -> None:
+    executor = TerraformExecutor()
+    executor._tf_bin = sys.executable
+    script = "import sys; sys.stdout.write('\\x1b[32mok\\x1b[0m \\u2500'); sys.stderr.write('')"
+
+    result = await executor._run_terraform_command(['-c', script], str(tmp_path), strip_ansi=False)
+
+    assert result['exit_code'] == 0
+    assert result['stdout'] == '\x1b[32mok\x1b[0m ─'
+    assert result['stderr'] == ''
+
+
+@pytest.mark.asyncio
+async def test_plan_terraform_can_skip_refresh(tmp_path) -> None:
+    executor = RecordingExecutor()
+    await executor.plan_terraform(str(tmp_path))
+    await executor.plan_terraform(str(tmp_path), refresh=False)
+    await executor.execute_in_workspace('plan', str(tmp_path), refresh=False)
+
+    assert '-refresh=false' not in executor.commands[0]
+    assert '-refresh=false' in executor.commands[1]
+    assert '-refresh=false' in executor.commands[2]
+
+
+@pytest.mark.asyncio
+async def test_run_terraform_command_raw_output_without_memfd(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.delattr('os.memfd_create', raising=False)
+    executor = TerraformExecutor()
+    executor._tf_bin = sys.executable
+
+    result = await executor._run_terraform_command(['-c', "print('raw')"], str(tmp_path), strip_ansi=False)
+
+    assert result['stdout'] == 'raw\n'
+
+
+@pytest.mark.asyncio
+async def test_clean_up_removes_pooled_directories() -> None:
+    executor = RecordingExecutor()
+    await executor.validate_hcl(AZURERM_HCL)
+    warm = executor.pool.get_nowait()
+    executor.pool.put_nowait(warm)
+
+    executor.clean_up()
+
+    assert executor.pool.empty()
+    assert not warm.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_new_directory_reuses_cached_lockfile() -> None:
+    executor = RecordingExecutor(max_instances=1)
+    try:
+        await executor.validate_hcl(AZURERM_HCL)
+        # Hold the pooled directory so the next validation needs a fresh one
+        async with executor._warm_dir(AZURERM_HCL) as held:
+            async with executor._warm_dir(AZURERM_HCL) as fresh:
+                assert fresh is not held
+                assert (fresh.path / '.terraform.lock.hcl').read_text() == AZURERM_LOCKFILE
+            async with executor._warm_dir(AZURERM_HCL.replace('~>3.0', '~>4.0')) as other:
+                assert not (other.path / '.terraform.lock.hcl').exists()
+    finally:
+        executor.clean_up()
+
+
+@pytest.mark.asyncio
+async def test_get_terraform_executor_allows_concurrent_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    from tf_mcp_server.core import terraform_executor
+
+    executor = TerraformExecutor()
+    executor._ready.set()
+    monkeypatch.setattr(terraform_executor, '_executor_instance', executor)
+    inside = asyncio.Event()
+
+    async def _hold() -> None:
+        async with terraform_executor.get_terraform_executor():
+            inside.set()
+            await asyncio.sleep(0.05)
+
+    holder = asyncio.create_task(_hold())
+    await inside.wait()
+    # A second caller must not wait for the first to finish its command
+    async with terraform_executor.get_terraform_executor() as second:
+        assert not holder.done()
+        assert second is executor
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_init_tf_probes_version_in_background(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    from tf_mcp_server.core import terraform_executor
+
+    fake_tf = tmp_path / 'terraform'
+    fake_tf.write_text('#!/bin/sh\necho "Terraform v1.9.0"\n')
+    fake_tf.chmod(0o755)
+    monkeypatch.setattr(terraform_executor.shutil, 'which', lambda name: str(fake_tf))
+    monkeypatch.setattr(terraform_executor, '_TF_BIN', None)
+    monkeypatch.setattr(terraform_executor, '_TF_VERSION', None)
+
+    executor = TerraformExecutor()
+    await executor.init_tf()
+
+    assert executor._ready.is_set()
+    assert executor._tf_bin == str(fake_tf)
+    await executor._version_task
+    assert terraform_executor._TF_VERSION == 'Terraform v1.9.0'
+
+
+def test_parse_terraform_errors_skips_malformed_json_lines() -> None:
+    stderr = (
+        '{"@level": "error", "@message": "first"}\n'
+        '{not json\n'
+        '{"@level": "warn", "@message": "ignored"}\n'
+        '{"@level": "error", "@message": "second"}\n'
+    )
+    assert TerraformExecutor()._parse_terraform_errors(stderr) == ['first', 'second']
+
+
+def test_parse_terraform_errors_groups_text_errors() -> None:
+    stderr = '╷\nError: Missing name\n  on main.tf line 1\n╵\nnot part of an error\nError: Bad type\n'
+    assert TerraformExecutor()._parse_terraform_errors(stderr) == [
+        'Error: Missing name\non main.tf line 1',
+        'Error: Bad type',
+    ]
+
+
+def test_parse_terraform_errors_returns_raw_stderr_without_error_blocks() -> None:
+    assert TerraformExecutor()._parse_terraform_errors('  plugin crashed\n') == ['plugin crashed']
+
+
+@pytest.mark.asyncio
+async def test_execute_in_workspace_builds_command_options(tmp_path) -> None:
+    executor = RecordingExecutor()
+    await executor.execute_in_workspace('apply', str(tmp_path), var_file='prod.tfvars', auto_approve=True)
+    await executor.execute_in_workspace('init', str(tmp_path), upgrade=True)
+    await executor.execute_in_workspace('state list', str(tmp_path), auto_approve=True)
+
+    assert executor.commands == [
+        ['apply', '-var-file', 'prod.tfvars', '-auto-approve', '-no-color'],
+        ['init', '-upgrade', '-no-color'],
+        ['state', 'list', '-no-color'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clean_output_text_async_matches_sync_for_large_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('tf_mcp_server.core.terraform_executor._THREAD_CLEAN_SIZE', 16)
+    executor = TerraformExecutor()
+    raw = "\x1b[1m│\x1b[0m Error: a -&gt; b\n" * 4
+
+    assert await executor._clean_output_text_async(raw) == executor._clean_output_text(raw)
+    assert await executor._clean_output_text_async('short') == 'short'
@@ -11,7 +11,8 @@ from tf_mcp_server.core.utils import (
     extract_hcl_from_markdown,
     normalize_resource_type,
     validate_azure_name,
-    format_terraform_block
+    format_terraform_block,
+    safe_filename
 )
 
 
@@ -41,6 +42,14 @@ resource "azurerm_key_vault" "example" {
     assert "# Some documentation" not in extracted
 
 
+def test_extract_hcl_from_markdown_edge_cases():
+    """Test HCL extraction for plain HCL, indented fences and unterminated blocks."""
+    assert extract_hcl_from_markdown('resource "azurerm_resource_group" "rg" {}') == ""
+    
+    indented = "  ```hcl\nname = \"a\"\n  ```\ntext ```hcl inline\n```terraform\nname = \"b\""
+    assert extract_hcl_from_markdown(indented) == 'name = "a"\nname = "b"'
+
+
 def test_normalize_resource_type():
     """Test resource type normalization."""
     assert normalize_resource_type("azurerm_storage_account") == "storage-account"
@@ -67,6 +76,13 @@ def test_validate_azure_name():
     errors = validate_azure_name("UPPERCASE", "storage_account")
     assert len(errors) > 0
     assert "lowercase" in errors[0]
+    
+    # A name failing both the generic and the specific rule reports both
+    errors = validate_azure_name("bad_vault@", "azurerm_key_vault")
+    assert len(errors) == 2
+    assert "underscores" in errors[0]
+    assert "Key Vault" in errors[1]
+    assert validate_azure_name("good-vault", "key_vault") == []
 
 
 def test_format_terraform_block():
@@ -86,3 +102,12 @@ def test_format_terraform_block():
     assert 'enabled = true' in result
     assert 'count = 3' in result
     assert 'Environment = "Test"' in result
+
+
+def test_safe_filename():
+    """Test replacement of characters invalid in file names."""
+    assert safe_filename("main.tf") == "main.tf"
+    assert safe_filename('a<b>c:d"e/f\\g|h?i*j') == "a_b_c_d_e_f_g_h_i_j"
+    assert safe_filename("café/ü.tf") == "café_ü.tf"
+    assert safe_filename("name. ") == "name"
+    assert safe_filename(". ") == "unnamed"